@@ -13,6 +13,8 @@ s.t. c_t + k_{t+1} = exp(sigma) k_t ^ {alpha}
 
 import numpy as np
 import matplotlib.pyplot as plt
+from macro_model.dp import bellman_operator, bellman_monotone, solve_multigrid
+from macro_model.trace import Trace
 
 #
 # set model parameter
@@ -43,51 +45,81 @@ optimal_decision = alpha*beta*A*(kgrid**alpha)
 k_ss = (alpha*beta*A)**(1/(1-alpha))       
 
 ''' numerical discrete solution '''
-# tabulate the utility function such that for zero or negative consumption utility
-# remains a large negative number so that such values will never be chosen as 
-# utiilty maximizing
+#
+# choose how to maximize the right side of bellman's equation:
+# 'brute' searches every k' for every k on the tabulated utility function;
+# 'monotone' uses that k' = f(k) increases in k and that the objective is
+# concave in k', so it never tabulates the utility and allows far finer grids
+search = 'brute'
 
 #
-# prepare for k and k'
-kk = np.array([kgrid]*nk)        # repeat array row-wise; k(t=1) increases along each row
-kkp = np.array([kgrid]*nk).T     # repeat array col-wise; k(t=2) increases along each col
+# bellman update on a capital grid
+def make_update(kgrid):
+    if search == 'brute':
+        # tabulate the utility function such that for zero or negative consumption utility
+        # remains a large negative number so that such values will never be chosen as 
+        # utiilty maximizing
+        nk = len(kgrid)
+        
+        #
+        # prepare for k and k'
+        kk = np.array([kgrid]*nk)        # repeat array row-wise; k(t=1) increases along each row
+        kkp = np.array([kgrid]*nk).T     # repeat array col-wise; k(t=2) increases along each col
+    
+        #
+        # impose budget constraint to get consumption
+        cons = A * (kk**alpha) - kkp
+    
+        #
+        # rule out negative consumption
+        cons[cons<=0] = np.nan                        # for log utility, zero consumption is not valid
+    
+        #
+        # log utility function
+        util = np.log(cons)
+    
+        #
+        # if consumption is negative, set utility to negative infinity
+        util[np.isnan(util)] = -np.inf
+        
+        return bellman_operator(util, beta)
+    return bellman_monotone(kgrid, A * (kgrid**alpha), np.log, beta)
 
 #
-# impose budget constraint to get consumption
-cons = A * (kk**alpha) - kkp
+# policy iteration acceleration: 0 for plain value function iteration, m to
+# apply each new decision rule m more times, 'exact' to solve for its value,
+# 'adaptive' to apply it more often as long as it does not change
+howard = 0
 
 #
-# rule out negative consumption
-cons[cons<=0] = np.nan                        # for log utility, zero consumption is not valid
+# stopping rule: 'relative' or 'absolute' error of the value function, on
+# its change per iteration or, with bounds = True, on the width of the
+# MacQueen-Porteus bounds on the solution, whose midpoint is returned
+criterion = 'relative'
+bounds = False
 
 #
-# log utility function
-util = np.log(cons)
+# coarse-to-fine warm start: number of points of the coarser grids solved
+# first, each solution interpolated as the initial guess on the next grid;
+# [] iterates on kgrid directly
+coarse_nk = []
+grids = [np.linspace(mink, maxk, n) for n in coarse_nk] + [kgrid]
 
 #
-# if consumption is negative, set utility to negative infinity
-util[np.isnan(util)] = -np.inf
+# convergence trace: Trace() records error, time and policy changes of every
+# iteration (see trace.to_csv); None runs without instrumentation
+trace = None
 
 #
 # initialize some variables
-test = 10
-v = -1 * np.ones(nk)
-decision = np.zeros(nk)
-nrow, ncol = util.shape
+v = -1 * np.ones(len(grids[0]))
 
 #
 # iterate on bellman's equation and get the decision rules and the value func
 # at the optimum
-while test > 1e-10:
-    # get updated value function and best decision
-    bellman = util + beta*(np.array([v]*nk).T)
-    tdecision = np.argmax(bellman,axis=0)
-    tv = np.max(bellman,axis=0)
-    
-    test = np.max(abs((tv - v)/v))
-    
-    v = tv
-    decision = tdecision
+v, tdecision, levels = solve_multigrid(make_update, grids, v, beta, tol=1e-10,
+                                       howard=howard, criterion=criterion, bounds=bounds,
+                                       callback=trace)
 
 decision = mink + tdecision * inck
 
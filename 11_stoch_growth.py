@@ -16,7 +16,12 @@ This program solves the following stochastic growth model:
 """
 
 import numpy as np
-from markov import markov_chain
+from macro_model.markov import markov_chain, rouwenhorst
+from macro_model.stationary import stationary_distribution
+from macro_model.dp import bellman_operator, bellman_monotone, solve_multigrid
+from macro_model.egm import solve_egm
+from macro_model.panel import simulate_panel
+from macro_model.trace import Trace
 
 #
 # set model parameters
@@ -31,6 +36,20 @@ prob   = np.array([                  # prob(i,j) = probability (A(t+1)=Aj|A(t)=A
                   [0.8, 0.2],        #        high    low  ---- col: t+1
                   [0.2, 0.8]         # high [             ]
                   ])                 # low  [             ]---- row: t
+A      = np.array([A_high, A_low])   # technology in each shock state
+
+#
+# more technology states: discretize log technology as an AR(1) with the
+# persistence and variance of the two-state process above; with 2 states
+# Rouwenhorst's method gives back exactly that process
+n_shocks = 2
+if n_shocks > 2:
+    rho_A  = prob[0,0] - prob[1,0]                       # persistence of log A
+    std_A  = (np.log(A_high) - np.log(A_low))/2          # unconditional std of log A
+    mean_A = (np.log(A_high) + np.log(A_low))/2          # unconditional mean of log A
+    log_A, prob = rouwenhorst(rho_A, std_A*np.sqrt(1-rho_A**2), n_shocks, mean_A*(1-rho_A))
+    A    = np.exp(log_A[::-1])                           # high first, as above
+    prob = prob[::-1,::-1]
 
 #
 # form capital grid
@@ -41,85 +60,108 @@ nk   = round((maxk-mink)/inck)
 kgrid = np.arange(mink, maxk, inck)        
 
 #
-# tabulate the utility function
+# period utility of consumption
+def utility(c):
+    if sigma == 1:
+        return np.log(c)
+    return ((c ** (1-sigma)) - 1)/(1-sigma)
 
-kk  = np.array([kgrid]*nk)           # repeat array row-wise; k(t=1) increases along each row
-kkp = np.array([kgrid]*nk).T         # repeat array col-wise; k(t=2) increases along each col
+#
+# choose how to maximize the right side of Bellman's equation:
+# 'brute' searches every k' for every k on the tabulated utility function;
+# 'monotone' uses that k' = f(k,A) increases in k and that the objective is
+# concave in k', so it never tabulates the utility and allows far finer grids
+search = 'brute'
 
-cons_high = A_high * (kk**alpha) + delta*kk - kkp       # consumption when tech shock is high
-cons_low  = A_low  * (kk**alpha) + delta*kk - kkp       # consumption when tech shock is low
+#
+# Bellman update on a capital grid: one (shock x k' x k) utility tensor, the
+# expected next period value given this period's shock is v @ prob.T
+def make_update(kgrid):
+    if search == 'brute':
+        #
+        # tabulate the utility function
+        nk = len(kgrid)
+        
+        kk  = np.array([kgrid]*nk)           # repeat array row-wise; k(t=1) increases along each row
+        kkp = np.array([kgrid]*nk).T         # repeat array col-wise; k(t=2) increases along each col
+        
+        cons = A[:,None,None] * (kk**alpha) + delta*kk - kkp   # consumption, first axis: tech shock
+        cons[cons<=0] = np.nan
+        
+        util = utility(cons)
+        util[np.isnan(util)] = -np.inf
+        
+        return bellman_operator(util, beta, prob)
+    resources = np.outer(kgrid**alpha, A) + delta*kgrid[:,None]   # col: tech shock
+    return bellman_monotone(kgrid, resources, utility, beta, prob)
 
-cons_high[cons_high<=0] = np.nan
-cons_low[cons_low<=0] = np.nan
+#
+# policy iteration acceleration: 0 for plain value function iteration, m to
+# apply each new decision rule m more times, 'exact' to solve for its value,
+# 'adaptive' to apply it more often as long as it does not change
+howard = 0
 
-if sigma == 1:
-    util_high = np.log(cons_high)
-    util_low  = np.log(cons_low)
-else:
-    util_high = ((cons_high ** (1-sigma)) - 1)/(1-sigma)
-    util_low  = ((cons_low  ** (1-sigma)) - 1)/(1-sigma)
+#
+# stopping rule: 'relative' or 'absolute' error of the value function, on
+# its change per iteration or, with bounds = True, on the width of the
+# MacQueen-Porteus bounds on the solution, whose midpoint is returned
+criterion = 'relative'
+bounds = False
 
-util_high[np.isnan(util_high)] = -np.inf
-util_low[np.isnan(util_low)]   = -np.inf
+#
+# coarse-to-fine warm start: number of points of the coarser grids solved
+# first, each solution interpolated as the initial guess on the next grid;
+# [] iterates on kgrid directly
+coarse_nk = []
+grids = [np.linspace(mink, kgrid[-1], n) for n in coarse_nk] + [kgrid]
+
+#
+# convergence trace of VFI, the stationary distribution and EGM: Trace()
+# records error, time and policy changes of every iteration (see
+# trace.summary() and trace.to_csv); None runs without instrumentation
+trace = None
 
 #
 # initialize some variables
-v = np.zeros((nk,2))          # first col: high; second col: low
-decision = np.zeros((nk,2))   # first col: high; second col: low
-test = 10
+v = np.zeros((len(grids[0]),len(A)))    # first col: high; last col: low
 
 #
 # iterate on Bellman's equation and get the decision rules and the value func
 # at the optimum
-while test > 1e-7:
-    v_high = np.matmul(v, prob[0,])    # expected next period value given this period high
-    v_low  = np.matmul(v, prob[1,])    # expected next period value given this period low
-    bellman_high = util_high + beta*(np.array([v_high]*nk).T)  # value func given high shock this period
-    bellman_low  = util_low  + beta*(np.array([v_low]*nk).T)   # value func given low shock this period
-    
-    tdecision_high = np.argmax(bellman_high, axis=0)    # given high shock, optimum decision
-    tdecision_low  = np.argmax(bellman_low, axis=0)     # given low shock, optimum decision
-    
-    tv_high = np.max(bellman_high, axis=0)    # given high shock, maximized value
-    tv_low = np.max(bellman_low, axis=0)      # given low shock, maximized value
-    
-    tdecision = np.array([tdecision_high, tdecision_low]).T
-    tv = np.array([tv_high, tv_low]).T
-    
-    test = np.max(np.max(abs((tv-v)/v)))
-    print(test)
-    
-    v = tv
-    decision = tdecision
-
-
-#
-# form transition matrix
-# trans is the transition matrix from state at t (row) to the state at t+1 (col)
-# the eigenvector associated with the unit eigenvalue of trans' is the stationary
-# distribution
+v, decision, levels = solve_multigrid(make_update, grids, v, beta, prob,
+                                      tol=1e-7, howard=howard, criterion=criterion, bounds=bounds,
+                                      callback=trace)
 
-g_high = np.zeros((nk,nk))
-g_low = np.zeros((nk,nk))
+tdecision_high = decision[:,0]    # given high shock, optimum decision
+tdecision_low  = decision[:,-1]   # given low shock, optimum decision
 
-for i in range(0,nk):
-    g_high[i, tdecision_high[i]] = 1
-    g_low[i, tdecision_low[i]] = 1
-    
-trans = np.vstack((np.hstack((prob[0,0]*g_high, prob[0,1]*g_high)),
-                   np.hstack((prob[1,0]*g_low,  prob[1,1]*g_low))))
-trans = trans.T
 
-probst = (1/(2*nk))*np.ones((2*nk,1))
-test = 1
-while test > 1e-8:
-    probst1 = np.matmul(trans, probst)
-    test = max(abs(probst1-probst))
-    probst = probst1
-    print(test)
+#
+# stationary distribution
+# the transition from state at t to the state at t+1 moves all mass at (k, A)
+# to (k'(k, A), A') with probability prob(A, A'), so it is applied straight
+# from the decision indices without forming the 2nk x 2nk transition matrix
+probst = stationary_distribution(decision, prob, tol=1e-8, callback=trace)
+probst = probst.flatten('F')[:,None]    # col major order, high then low
 
 
 #
 # vectorize the decision rule to be conformable with probst
 # calculate mean level of capital
 veck = decision.flatten('F')   # col major order
+
+
+#
+# simulate a panel of 10^5 economies for 200 periods from the decision rule,
+# starting from the stationary distribution; only the time-series moments
+# (mean, std, first-order autocorrelation) of k, y, c and i are kept
+output  = np.outer(kgrid**alpha, A)       # col: tech shock
+moments = simulate_panel(decision, prob, kgrid, output, delta, T=200,
+                         n_econ=100000, seed=0)
+
+
+#
+# the same model by the endogenous grid method: continuous decision rules on
+# kgrid from the Euler equation, without tabulating utility or maximizing
+kprime_egm, cons_egm, info_egm = solve_egm(kgrid, alpha, beta, delta, sigma,
+                                           A, prob, callback=trace)
@@ -7,25 +7,24 @@ This program plots US GDP
 @author: Zicong Huang
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import ticker
+from macro_model.table_cache import load_usgdp
 
 #
-# load GDP data
-gdp_data = pd.read_excel('USGDP_1790-2019.xlsx', header=1)
+# load GDP data, parsed once and then memory-mapped from the column cache
+gdp_data = load_usgdp('USGDP_1790-2019.xlsx', as_frame=True)
 
 #
 # extract column values
-varnames = list(gdp_data)
-year = gdp_data[varnames[0]]
-nominal_gdp = gdp_data[varnames[1]]*1e6
-real_gdp = gdp_data[varnames[2]]*1e6
-gdp_deflator = gdp_data[varnames[3]]
-pop = gdp_data[varnames[4]]*1e3
-nominal_gdp_pc = gdp_data[varnames[5]]
-real_gdp_pc = gdp_data[varnames[6]]
+year = gdp_data['year']
+nominal_gdp = gdp_data['nominal_gdp']*1e6
+real_gdp = gdp_data['real_gdp']*1e6
+gdp_deflator = gdp_data['gdp_deflator']
+pop = gdp_data['population']*1e3
+nominal_gdp_pc = gdp_data['nominal_gdp_pc']
+real_gdp_pc = gdp_data['real_gdp_pc']
 
 #
 # plot nominal GDP
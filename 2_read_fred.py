@@ -5,16 +5,19 @@ Created on Wed Dec 16 08:22:36 2020
 @author: Zicong Huang
 """
 
-from fredapi import Fred
+from macro_model.fred_data import FredCache
 import matplotlib.pyplot as plt
 
-# need add fred api to environment variable
-fred = Fred()
+# need add fred api to environment variable; series are cached on disk for a
+# day, set FRED_OFFLINE=1 to run from the cache only
+fred = FredCache()
+# both series fetched concurrently, aligned on the union of their dates
+data = fred.get_many(['GDP', 'ICSA'])
 
 #
 # plot nominal gdp
-gdp = fred.get_series('GDP') # Billions of Dollars, Seasonally Adjusted Annual Rate
-gdp = gdp.dropna()           # drop missing values
+gdp = data['GDP']  # Billions of Dollars, Seasonally Adjusted Annual Rate
+gdp = gdp.dropna() # drop missing values
 
 fig1, ax = plt.subplots(figsize=(10,6), dpi=300)
 ax.plot(gdp)
@@ -25,7 +28,7 @@ ax.set_yticklabels(['{:,}'.format(int(x)) for x in ax.get_yticks().tolist()]) #
 
 #
 # plot initial claims
-ICSA = fred.get_series('ICSA') # weekly, seasonally adjusted, initial claim of unemployment
+ICSA = data['ICSA'].dropna() # weekly, seasonally adjusted, initial claim of unemployment
 
 fig2, ax = plt.subplots(figsize=(10,6), dpi=300)
 ax.plot(ICSA/1e6)
@@ -4,41 +4,16 @@ Created on Wed Dec 16 08:26:11 2020
 
 @author: Zicong Huang
 """
-from fredapi import Fred
+from macro_model.fred_data import FredCache
+from macro_model.timeseries import indicator_intervals, hpfilter
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.filters.hp_filter import hpfilter
 
-fred = Fred()
+fred = FredCache()    # cached on disk for a day, FRED_OFFLINE=1 to run from the cache only
 rgdp = fred.get_series('GDPC1')
 rec = fred.get_series('USREC', '1947-01-01')
 
-#
-# get recession starts and ends
-def get_recession_start_end(dataframe):
-    # series not begin in recession
-    in_rec = 0
-    rec_start = list()
-    rec_end = list()
-    rec_period = list()
-    dates = rec.index
-    for date in dates:
-        if in_rec == 0 and dataframe[date] == 1:
-            rec_start.append(date)
-            in_rec = 1
-        if in_rec == 1 and dataframe[date] == 0:
-            rec_end.append(date)
-            in_rec = 0
-    
-    for i in range(0, len(rec_end)):
-        rec_period.append((rec_start[i],rec_end[i]))
-    
-    if len(rec_start) > len(rec_end):
-        rec_period.append((rec_start[-1], dates[-1]))
-        
-    return rec_period
-
 #
 # plot real gdp 
 fig1,ax = plt.subplots(figsize=(10,6), dpi = 300)
@@ -46,10 +21,10 @@ ax.plot(rgdp/1e3)
 ax.set_xlabel('time')
 ax.set_ylabel('trillions of chained 2012 dollars')
 ax.set_title('US Real GDP, Quarterly')
-# shade recession periods
-rec_dates = get_recession_start_end(rec)
-for pair in rec_dates:
-    ax.axvspan(pair[0], pair[1], color='grey', alpha=0.3)
+# shade recession periods, [start, end) of each run of USREC == 1
+rec_dates = indicator_intervals(rec)
+for interval in rec_dates:
+    ax.axvspan(interval.left, interval.right, color='grey', alpha=0.3)
     
 # apply hpfilter
 cycle, trend = hpfilter(rgdp)
@@ -63,8 +38,8 @@ ax.set_xlabel('time')
 ax.set_ylabel('trillions of chained 2012 dollars')
 ax.set_title('US Real GDP, Quarterly')
 ax.legend()
-for pair in rec_dates:
-    ax.axvspan(pair[0], pair[1], color='grey', alpha=0.3)
+for interval in rec_dates:
+    ax.axvspan(interval.left, interval.right, color='grey', alpha=0.3)
 
 #
 # log deviations from trend
@@ -78,8 +53,8 @@ ax.plot(log_devia*400) # why multiply by 400: annualize quarterly data
 ax.set_title('Log Deviations of Quarterly Real GDP from its Trend')
 ax.set_xlabel('time')
 ax.set_ylabel('percentage deviation')
-for pair in rec_dates:
-    ax.axvspan(pair[0], pair[1], color='grey', alpha=0.3)
+for interval in rec_dates:
+    ax.axvspan(interval.left, interval.right, color='grey', alpha=0.3)
 
 #
 # log first difference
@@ -93,6 +68,6 @@ plt.hlines(0, min(rgdp.index), max(rgdp.index), colors='red')
 ax.set_title('Log First Difference of US Real GDP, Quarterly')
 ax.set_xlabel('time')
 ax.set_ylabel('first differences (in logs)')
-for pair in rec_dates:
-    ax.axvspan(pair[0], pair[1], color='grey', alpha=0.3)
+for interval in rec_dates:
+    ax.axvspan(interval.left, interval.right, color='grey', alpha=0.3)
     
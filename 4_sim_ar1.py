@@ -6,16 +6,13 @@ Created on Wed Dec 16 19:15:22 2020
 """
 
 import matplotlib.pyplot as plt
-import numpy as np
+from macro_model.ar1 import simulate_ar1
 
 #
 # AR(1), flip of coin
 T = 100
 rho = 0.95
-x = np.zeros(T)
-coin = np.array([1, -1])
-for i in range(0, T-1):
-    x[i+1] = rho*x[i] + np.random.choice(coin)
+x = simulate_ar1(rho, T, shocks='coin')     # shocks: +1 or -1 with equal probability
 
 fig1,ax = plt.subplots(dpi = 300)
 ax.plot(x)
@@ -25,11 +22,7 @@ ax.set_title('AR(1) simulation of a flip of coin')
 
 #
 # two more series
-y = np.zeros(T)
-z = np.zeros(T)
-for i in range(0, T-1):
-    y[i+1] = rho*y[i] + np.random.choice(coin)
-    z[i+1] = rho*z[i] + np.random.choice(coin)
+y, z = simulate_ar1(rho, T, n_series=2, shocks='coin')
 
 fig2,ax = plt.subplots(dpi = 300)
 ax.plot(x)
@@ -5,7 +5,7 @@ Created on Wed Dec 16 21:50:30 2020
 @author: zicong huang
 """
 
-from markov import markov_chain
+from macro_model.markov import markov_chain
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -7,7 +7,8 @@ Created on Thu Dec 17 15:36:08 2020
 This program simulate a baseline solow model
 """
 import numpy as np
-import matplotlib.pyplot as plt
+from macro_model.solow import simulate_solow, steady_state
+from macro_model.figures import FigureSpec, render
 #
 # set initial value for K, N, Y
 K0 = 300       # capital stock
@@ -28,37 +29,28 @@ start_year = 2000
 A0 = Y0/((K0**alpha)*(N0**(1-alpha)))
 
 #
-# initialize time series
-# compute initial capital-to-labor ratio
-K_N = np.zeros(T)        # capital-to-labor ratio
-N = np.zeros(T)
-K_N[0] = K0/N0
-N[0] = N0
-A = np.ones(T)*A0        # Solow residuals not changed
+# simulate model, Solow residuals not changed
+paths = simulate_solow(T, s, n, delta, alpha, A0, K0=K0, N0=N0)
+K_N = paths['K_N']       # capital-to-labor ratio
+N = paths['N']
 
 #
-# simulate model
-for t in range(0, T-1):
-    N[t+1] = (1 + n) * N[t]
-    K_N[t+1] = ((1-delta)*K_N[t])/(1+n) + (s*A[t]*(K_N[t] ** alpha))/(1+n)
-
-#
-# compute output per worker, total capital, total output, wages and rental rate
-# of capital
-Y_N = A * K_N ** alpha
+# output per worker, total capital, total output, wages and rental rate of
+# capital
+Y_N = paths['Y_N']
 K = K_N * N
-Y = A * (K ** alpha) * (N ** (1-alpha))
-rental_rate = alpha * A * (K ** (alpha-1)) * (N ** (1-alpha))
-wages = (1-alpha) * A * (K ** (alpha)) * (N ** (-alpha))
+Y = Y_N * N
+rental_rate = paths['rent']
+wages = paths['wage']
 
 #
 # steady state
-K_N_ss = (s*A/(n + delta))**(1/(1-alpha))
-Y_N_ss = A * K_N_ss ** (alpha)
+K_N_ss = steady_state(s, n, delta, alpha, A0, approx=True)
+Y_N_ss = A0 * K_N_ss ** (alpha)
 K_ss = K_N_ss * N
-Y_ss = A * (K_ss ** alpha) * (N ** (1-alpha))
-wage_ss = (1-alpha) * A * (K_ss ** (alpha)) * (N ** (-alpha))
-rent_ss = alpha * A * (K_ss ** (alpha-1)) * (N ** (1-alpha))
+Y_ss = Y_N_ss * N
+wage_ss = (1-alpha) * Y_N_ss
+rent_ss = alpha * Y_N_ss / K_N_ss
 
 #
 # growth rate log first difference
@@ -77,146 +69,143 @@ outflow = (n + delta) * kk
 inflow = s * A0 * kk ** alpha
 output_pc = A0 * kk ** alpha
 
-kk_ss = np.argwhere(np.diff(np.sign(inflow - outflow))).flatten() # find intersection: steady state
+kk_ss = steady_state(s, n, delta, alpha, A0)     # intersection: steady state
 
 #
 # solow diagram 2
 kk_t1 = np.arange(0, TT)
-kk_t2 = np.zeros(TT)
-for t in range(0,TT):
-    kk_t2[t] = ((1-delta)*kk_t1[t])/(1+n) + (s*A0*(kk_t1[t] ** alpha))/(1+n)
+kk_t2 = ((1-delta)*kk_t1)/(1+n) + (s*A0*(kk_t1 ** alpha))/(1+n)
 
-kk_ss2 = np.argwhere(np.diff(np.sign(kk_t2 - kk_t1))).flatten() # find intersection: steady state
+kk_ss2 = steady_state(s, n, delta, alpha, A0)    # intersection with 45 degree line: steady state
 
 
 #
-# plottings
+# plottings, recorded as figure specs and rendered headless to figures/;
+# FIGURE_PREVIEW=1 renders quick low resolution previews
 year = np.arange(start_year,start_year+T)
+figs = []
 
-fig0, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('solow_diagram_1')
+figs.append(ax)
 ax.plot(kk, inflow, label = r'$sf(k)$')
 ax.plot(kk, output_pc, label = r'$f(k)$')
 ax.plot(kk, outflow, label = r'($n+\delta)k$')
-if len(kk_ss) == 2:
-    kk_ss = kk_ss[1]
-    inflow_ss = inflow[kk_ss]
-    output_pc_ss = output_pc[kk_ss]
-
-    ax.vlines(kk_ss, 0, output_pc_ss, linestyles = 'dotted', colors = 'black')
-    ax.hlines(inflow_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
-    ax.hlines(output_pc_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
+inflow_ss = s * A0 * kk_ss ** alpha
+output_pc_ss = A0 * kk_ss ** alpha
+
+ax.vlines(kk_ss, 0, output_pc_ss, linestyles = 'dotted', colors = 'black')
+ax.hlines(inflow_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
+ax.hlines(output_pc_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
 ax.set_xlim(xmin = 0)
 ax.set_ylim(ymin = 0)
 ax.legend()
 ax.set_xlabel(r'$k$')
 ax.set_ylabel('values')
 ax.set_title('solow diagram 1')
-plt.show()
 
 
 motion = r'$k_{t+1}=\frac{(1-\delta)}{1+n} \times k_{t} + \frac{s \times A}{1+n} \times k_{t}^\alpha $'
-fig1, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('solow_diagram_2')
+figs.append(ax)
 ax.plot(kk_t1,kk_t2, label = motion)
-xx = np.linspace(*ax.get_xlim()) # linspace: evenly spaced numbers of a specified intervals
-ax.plot(xx, xx, label = r'$45^\circ$') # star expression: pass all items as arguments
-plt.axis('scaled')
+ax.axline((0, 0), slope = 1, color = 'C1', label = r'$45^\circ$')
+ax.axis('scaled')
 ax.set_xlim(xmin = 0)
 ax.set_ylim(ymin = 0)
-if len(kk_ss2) == 2:
-    kk_ss2 = kk_ss2[1]
-    ax.vlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
-    ax.hlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
+ax.vlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
+ax.hlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
 ax.legend(prop={'size': 15})
 ax.set_xlabel(r'$k_{t}$')
 ax.set_ylabel(r'$k_{t+1}$')
 ax.set_title('solow diagram 2')
-plt.show()
 
 
-fig2, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('capital_labor_ratio')
+figs.append(ax)
 ax.plot(year ,K_N)
 ax.set_xlabel('Year')
 ax.set_ylabel('capital-to-labor')
 ax.set_title('simulated path of the capital-to-labor ratio')
-plt.hlines(K_N_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
-plt.xticks(year[::10])
+ax.hlines(K_N_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
+ax.set_xticks(year[::10])
 ax.legend(loc = 4)
-plt.show()
 
 
-fig3, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('output_per_worker')
+figs.append(ax)
 ax.plot(year, Y_N)
 ax.set_xlabel('Year')
 ax.set_ylabel('output-per-worker')
 ax.set_title('simulated time path of real GDP per worker')
-plt.hlines(Y_N_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
-plt.xticks(year[::10])
+ax.hlines(Y_N_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
+ax.set_xticks(year[::10])
 ax.legend(loc = 4)
-plt.show()
 
 
-fig4, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('wage')
+figs.append(ax)
 ax.plot(year, wages)
 ax.set_xlabel('Year')
 ax.set_ylabel('wages')
 ax.set_title('simulated time path of real wage')
-plt.hlines(wage_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
-plt.xticks(year[::10])
+ax.hlines(wage_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
+ax.set_xticks(year[::10])
 ax.legend(loc = 4)
-plt.show()
 
 
-fig5, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('rental_rate')
+figs.append(ax)
 ax.plot(year, rental_rate)
 ax.set_xlabel('Year')
 ax.set_ylabel('rental rate of capital')
 ax.set_title('simulated time path of real rental rate')
-plt.hlines(rent_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
-plt.xticks(year[::10])
+ax.hlines(rent_ss, min(year), max(year), colors='red', linestyles='--',label = 'steady state')
+ax.set_xticks(year[::10])
 ax.legend(loc = 1)
-plt.show()
 
 
-fig6, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('output')
+figs.append(ax)
 ax.plot(year, Y)
 ax.plot(year, Y_ss, 'r--', label = 'steady state')
 ax.set_xlabel('Year')
 ax.set_ylabel('output')
 ax.set_title('simulated time path of real GDP')
-plt.xticks(year[::10])
+ax.set_xticks(year[::10])
 ax.legend(loc = 0)
-plt.show()
 
 
-fig7, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('capital')
+figs.append(ax)
 ax.plot(year, K)
 ax.plot(year, K_ss, 'r--', label = 'steady state')
 ax.set_xlabel('Year')
 ax.set_ylabel('capital')
 ax.set_title('simulated time path of capital stock')
-plt.xticks(year[::10])
+ax.set_xticks(year[::10])
 ax.legend(loc = 0)
-plt.show()
 
 
-fig8, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('log_output')
+figs.append(ax)
 ax.plot(year, np.log(Y))
 ax.plot(year, np.log(Y_ss), 'r--', label = 'steady state')
 ax.set_xlabel('Year')
 ax.set_ylabel('log output')
 ax.set_title('simulated time path of log real GDP')
-plt.xticks(year[::10])
+ax.set_xticks(year[::10])
 ax.legend(loc = 0)
-plt.show()
 
 
-fig9, ax = plt.subplots(figsize = (10,6), dpi = 300)
+ax = FigureSpec('output_growth')
+figs.append(ax)
 ax.plot(year[1:], Y_growth * 100)
 ax.plot(year[1:], Y_ss_growth * 100, 'r--', label = 'steady state')
 ax.set_xlabel('Year')
 ax.set_ylabel('percentage growth rate')
 ax.set_title('simulated time path of real GDP growth')
-plt.hlines(0, min(year), max(year), colors='black')
-plt.xticks(year[::10])
+ax.hlines(0, min(year), max(year), colors='black')
+ax.set_xticks(year[::10])
 ax.legend(loc = 0)
-plt.show()
+
+render(figs)
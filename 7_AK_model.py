@@ -7,6 +7,7 @@ Created on Sat Dec 19 11:40:53 2020
 
 import numpy as np
 import matplotlib.pyplot as plt
+from macro_model.solow import simulate_ak
 
 # set initial inputs
 K0 = 1    # initial capital stock
@@ -24,27 +25,14 @@ start_year = 2000
 # initial value of output
 A0 = Y0/((K0**alpha)*(N0**(1-alpha)))
 
-# initialize time series
-K_N = np.zeros(T)
-N = np.zeros(T)
-K_N[0] = K0/N0
-N[0] = N0
-A = np.zeros(T)
-A[0] = A0
-
 # simulate the model
-for t in range(0, T-1):
-    N[t+1] = (1 + n) * N[t]
-    K_N[t+1] = ((1-delta)/(1+n)) * K_N[t] + (s/(1+n)) * A0 * K_N[t]
-
-for t in range(1, T):
-    A[t] = A0 * (K_N[t] ** (1-alpha))
-
-# compute
-Y_N = A * (K_N ** alpha)
-K = K_N * N
-wages = (1-alpha) * A * (K ** (alpha)) * (N ** (-alpha))
-rental_rate = alpha * A * (K ** (alpha-1)) * (N ** (1-alpha))
+paths = simulate_ak(T, s, n, delta, alpha, A0, K0, N0)
+K_N = paths['K_N']
+Y_N = paths['Y_N']
+A = paths['TFP']            # measured TFP, A0 * k^(1-alpha)
+K = paths['K']
+wages = paths['wage']
+rental_rate = paths['rent']
 
 
 # plots
@@ -9,6 +9,7 @@ This program simulate the solow model with labor-augmenting technology
 
 import numpy as np
 import matplotlib.pyplot as plt
+from macro_model.solow import simulate_solow, steady_state
 
 #
 # set initial inputs
@@ -31,40 +32,30 @@ start_year = 2000   # simulation start year
 # back out value of A
 Y0 = A0 * (K0**(alpha)) * ((E0*N0)**(1-alpha))
 
-#
-# initialize time series
-K_EN = np.zeros(T)          # capital per effective labor
-N = np.zeros(T)
-E = np.zeros(T)
-K_EN[0] = K0 / (E0 * N0)
-N[0] = N0
-E[0] = E0
-EN = E * N                 # effective labor 
-
 #
 # simulate the model
-for t in range(0,T-1):
-    K_EN[t+1] = ((1-delta)/((1+g)*(1+n)))*K_EN[t] + (s/((1+g)*(1+n)))*A0*(K_EN[t]**alpha)
-    N[t+1] = (1+n) * N[t]
-    E[t+1] = (1+g) * E[t]
-
-EN = E*N
+paths = simulate_solow(T, s, n, delta, alpha, A0, g, K0=K0, N0=N0, E0=E0)
+K_EN = paths['K_EN']        # capital per effective labor
+N = paths['N']
+E = paths['E']
+EN = E*N                    # effective labor
 
 #
 # compute a bunch of values
 Y_EN = A0 * (K_EN ** alpha)
-Y_N = Y_EN * E
+Y_N = paths['Y_N']
 Y = Y_N * N
 
-K_N = K_EN * E
+K_N = paths['K_N']
 K = K_N * N
 
-wage = alpha * A0 * (K**(1-alpha)) * (N**(alpha-1)) * (E ** alpha)
-rent = (1-alpha) * A0 * (K**(-alpha)) * ((E * N) **alpha)
+# marginal products of labor and capital
+wage = paths['wage']
+rent = paths['rent']
 
 #
 # steady state
-K_EN_ss = ((s*A0)/((1+g)*(1+n)-(1-delta))) ** (1/(1-alpha))
+K_EN_ss = steady_state(s, n, delta, alpha, A0, g)
 Y_EN_ss = A0 * (K_EN_ss ** alpha)
 
 K_N_ss = K_EN_ss * E
@@ -73,8 +64,8 @@ Y_N_ss = Y_EN_ss * E
 K_ss = K_N_ss * N
 Y_ss = Y_N_ss * N
 
-wage_ss = alpha * A0 * (K_ss**(1-alpha)) * (N**(alpha-1)) * (E ** alpha)
-rent_ss = (1-alpha) * A0 * (K_ss**(-alpha)) * ((E * N) **alpha)
+wage_ss = (1-alpha) * Y_N_ss
+rent_ss = alpha * (Y_EN_ss / K_EN_ss) * np.ones(T)
 
 #
 # solow diagram 1
@@ -83,16 +74,14 @@ kk = np.arange(0, TT)
 outflow = kk * (g + n + delta)
 inflow = s * A0 * (kk ** alpha)
 output_pel = A0 * (kk ** alpha)     # output per effective labor
-kk_ss = np.argwhere(np.diff(np.sign(inflow - outflow))).flatten() # find intersection: steady state
+kk_ss = steady_state(s, n, delta, alpha, A0, g, approx=True)   # intersection: steady state
 
 #
 # solow diagram 2
 kk_t1 = np.arange(0, TT)
-kk_t2 = np.zeros(TT)
-for t in range(0,TT):
-    kk_t2[t] = ((1-delta)*kk_t1[t])/((1+g)*(1+n)) + (s*A0*(kk_t1[t] ** alpha))/((1+g)*(1+n))
+kk_t2 = ((1-delta)*kk_t1)/((1+g)*(1+n)) + (s*A0*(kk_t1 ** alpha))/((1+g)*(1+n))
 
-kk_ss2 = np.argwhere(np.diff(np.sign(kk_t2 - kk_t1))).flatten() # find intersection: steady state
+kk_ss2 = steady_state(s, n, delta, alpha, A0, g)   # intersection with 45 degree line: steady state
 
 #
 # plots
@@ -102,14 +91,12 @@ fig0, ax = plt.subplots(figsize = (10,6), dpi = 300)
 ax.plot(kk, inflow, label = r'$sf(\tilde{k})$')
 ax.plot(kk, output_pel, label = r'$f(\tilde{k})$')
 ax.plot(kk, outflow, label = r'($n+g+\delta)\tilde{k}$')
-if len(kk_ss) == 2:
-    kk_ss = kk_ss[1]
-    inflow_ss = inflow[kk_ss]
-    output_pel_ss = output_pel[kk_ss]
-    
-    ax.vlines(kk_ss, 0, output_pel_ss, linestyles = 'dotted', colors = 'black')
-    ax.hlines(inflow_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
-    ax.hlines(output_pel_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
+inflow_ss = s * A0 * (kk_ss ** alpha)
+output_pel_ss = A0 * (kk_ss ** alpha)
+
+ax.vlines(kk_ss, 0, output_pel_ss, linestyles = 'dotted', colors = 'black')
+ax.hlines(inflow_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
+ax.hlines(output_pel_ss, 0, kk_ss, linestyles = 'dotted', colors = 'black')
 ax.set_xlim(xmin = 0)
 ax.set_ylim(ymin = 0)
 ax.legend()
@@ -126,10 +113,8 @@ ax.plot(xx, xx, label = r'$45^\circ$') # star expression: pass all items as argu
 plt.axis('scaled')
 ax.set_xlim(xmin = 0)
 ax.set_ylim(ymin = 0)
-if len(kk_ss2) == 2:
-    kk_ss2 = kk_ss2[1]
-    ax.vlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
-    ax.hlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
+ax.vlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
+ax.hlines(kk_ss2, 0, kk_ss2, linestyles = 'dotted', colors = 'black')
 ax.legend(prop={'size': 12})
 ax.set_xlabel(r'$\widetilde{k_{t}}$')
 ax.set_ylabel(r'$\widetilde{k_{t+1}}$')
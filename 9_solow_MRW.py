@@ -8,6 +8,7 @@ This program simulate a solow model with human capital
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from macro_model.solow import simulate_mrw, steady_state_mrw
 
 # initial inputs
 K0 = 5
@@ -32,44 +33,30 @@ start_year = 2000
 # initial GDP
 Y0 = A * (K0**alpha) * (H0**beta) * ((E0*N0)**gamma)
 
-# initialize time series
-K_EN = np.zeros(T)
-H_EN = np.zeros(T)
-E = np.zeros(T)
-N = np.zeros(T)
-EN = np.zeros(T)
-
-K_EN[0] = K0/(E0*N0)
-H_EN[0] = H0/(E0*N0)
-E[0] = E0
-N[0] = N0
-EN[0] = E0*N0
-
 # simulate the model
-for t in range(0,T-1):
-    K_EN[t+1] = ((1-delta_k)/((1+g)*(1+n)))*K_EN[t] + ((sk*A)/((1+g)*(1+n)))*(K_EN[t]**alpha)*(H_EN[t]**beta)
-    H_EN[t+1] = ((1-delta_h)/((1+g)*(1+n)))*H_EN[t] + ((sh*A)/((1+g)*(1+n)))*(K_EN[t]**alpha)*(H_EN[t]**beta)
-    E[t+1] = (1+g) * E[t]
-    N[t+1] = (1+n) * N[t]
-    
+paths = simulate_mrw(T, sk, sh, n, g, delta_k, delta_h, alpha, beta, A,
+                     K0=K0, H0=H0, N0=N0, E0=E0)
+K_EN = paths['K_EN']
+H_EN = paths['H_EN']
+E = paths['E']
+N = paths['N']
 EN = E*N
 
 # compute a bunch of values
 Y_EN = A * (K_EN**alpha) * (H_EN**beta)
-K_N = K_EN*E
-H_N = H_EN*E
+K_N = paths['K_N']
+H_N = paths['H_N']
 K = K_N * N
 H = H_N * N
-Y_N = Y_EN*E
+Y_N = paths['Y_N']
 Y = Y_N * N
-wage = gamma * A * (K**alpha) * (H**beta) * (E**gamma) * (N**(gamma-1))
-rent_k = alpha * A * (K**(alpha-1)) * (H**beta) * ((E*N) ** gamma)
-rent_h = beta * A * (K**alpha) * (H**(beta-1)) * ((E*N) ** gamma)
+wage = paths['wage']
+rent_k = paths['rent_k']
+rent_h = paths['rent_h']
 
 
 # steady state
-K_EN_ss = ((((sk*A)/(n+g+delta_k))**(1-beta)) * (((sh*A)/(n+g+delta_h))**beta))**(1/gamma)
-H_EN_ss = ((((sk*A)/(n+g+delta_k))**(alpha)) * (((sh*A)/(n+g+delta_h))**(1-alpha)))**(1/gamma)
+K_EN_ss, H_EN_ss = steady_state_mrw(sk, sh, n, g, delta_k, delta_h, alpha, beta, A)
 K_N_ss = K_EN_ss*E
 H_N_ss = H_EN_ss*E
 K_ss = K_N_ss * N
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:21:37 2026
+
+@author: Zicong Huang
+
+benchmarks of the macro_model hot paths, run from the repository root with
+
+    python -m benchmarks                      # run and print scaling table
+    python -m benchmarks --save-baseline      # store results as the baseline
+    python -m benchmarks --compare            # flag regressions vs baseline
+
+see benchmarks/cases.py for what is measured
+"""
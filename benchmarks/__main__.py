@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:21:37 2026
+
+@author: Zicong Huang
+
+benchmark runner: times and peak memory of every case at every size, the
+empirical scaling exponent of each case, JSON baselines and regression
+flags; python -m benchmarks --help for the options
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+import numpy as np
+from benchmarks.cases import CASES
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def measure(run, min_time=0.2, max_repeat=7):
+    '''
+    times run() until min_time has passed (at least 2, at most max_repeat
+    runs after one warm-up), then traces the peak memory of one more run
+
+    Returns
+    -------
+    record : dict
+        'best' and 'median' seconds, 'repeat' number of timed runs and
+        'peak_mb' peak traced allocation in MB
+    '''
+    run()
+    times = []
+    while len(times) < max_repeat and (len(times) < 2 or sum(times) < min_time):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'best': min(times), 'median': float(np.median(times)),
+            'repeat': len(times), 'peak_mb': peak / 2**20}
+
+
+def scaling_exponent(sizes, seconds):
+    '''slope of log time on log size: 1 linear, 2 quadratic'''
+    if len(sizes) < 2:
+        return float('nan')
+    return float(np.polyfit(np.log(sizes), np.log(seconds), 1)[0])
+
+
+def run_cases(names, quick=False, min_time=0.2):
+    results = {}
+    for name in names:
+        setup, sizes, unit = CASES[name]
+        if quick:
+            sizes = sizes[:2]
+        runs = {}
+        for size in sizes:
+            runs[str(size)] = measure(setup(size), min_time)
+            print('%-12s %12s %-12s %10.4f s %9.1f MB'
+                  % (name, size, unit, runs[str(size)]['median'], runs[str(size)]['peak_mb']),
+                  flush=True)
+        results[name] = {'unit': unit, 'runs': runs,
+                         'exponent': scaling_exponent(sizes, [runs[str(n)]['best'] for n in sizes])}
+    return results
+
+
+def compare(results, baseline, threshold=0.25, min_seconds=1e-3):
+    '''
+    regressions against a baseline: best time or peak memory more than
+    threshold above the baseline; times below min_seconds in both are
+    treated as noise
+
+    Returns
+    -------
+    flags : list of str
+    '''
+    flags = []
+    for name, result in results.items():
+        base = baseline.get('cases', {}).get(name, {}).get('runs', {})
+        for size, record in result['runs'].items():
+            if size not in base:
+                continue
+            old = base[size]
+            if (record['best'] > (1 + threshold)*old['best']
+                    and record['best'] - old['best'] > min_seconds):
+                flags.append('%s at %s: %.4f s vs %.4f s (%+.0f%%)'
+                             % (name, size, record['best'], old['best'],
+                                100*(record['best']/old['best'] - 1)))
+            if record['peak_mb'] > (1 + threshold)*old['peak_mb'] + 1:
+                flags.append('%s at %s: %.1f MB vs %.1f MB peak memory'
+                             % (name, size, record['peak_mb'], old['peak_mb']))
+    return flags
+
+
+def plot(results, out_dir):
+    '''log-log scaling curve of each case, rendered with macro_model.figures'''
+    from macro_model.figures import FigureSpec, render
+    specs = []
+    for name, result in results.items():
+        sizes = np.array([int(n) for n in result['runs']])
+        best = np.array([r['best'] for r in result['runs'].values()])
+        spec = FigureSpec('bench_' + name, dpi=100)
+        spec.loglog(sizes, best, 'o-')
+        spec.set_xlabel(result['unit'])
+        spec.set_ylabel('seconds')
+        spec.set_title('%s, time ~ size^%.2f' % (name, result['exponent']))
+        specs.append(spec)
+    return render(specs, out_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='benchmarks of the macro_model hot paths')
+    parser.add_argument('cases', nargs='*', help='cases to run, all if none: ' + ', '.join(CASES))
+    parser.add_argument('--quick', action='store_true', help='only the two smallest sizes')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds to spend timing each size')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--compare', action='store_true', help='flag regressions against the baseline, exit 1 if any')
+    parser.add_argument('--threshold', type=float, default=0.25, help='relative slowdown flagged as a regression')
+    parser.add_argument('--plot', metavar='DIR', help='render scaling curves to this directory')
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error('unknown cases: ' + ', '.join(sorted(unknown)))
+    if args.compare:
+        # read before running, so that --save-baseline --compare compares
+        # against the previous baseline, not the one it writes
+        try:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        except OSError:
+            print('no baseline at %s, run with --save-baseline first' % args.baseline)
+            return 2
+    results = run_cases(args.cases or list(CASES), args.quick, args.min_time)
+
+    print('\nscaling exponents (time ~ size^p)')
+    for name, result in results.items():
+        print('%-12s p = %5.2f' % (name, result['exponent']))
+
+    report = {'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+              'machine': {'python': platform.python_version(), 'numpy': np.__version__,
+                          'platform': platform.platform(), 'cpus': os.cpu_count()},
+              'cases': results}
+    for path in [args.output] + ([args.baseline] if args.save_baseline else []):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=1)
+            print('results written to', path)
+    if args.plot:
+        plot(results, args.plot)
+
+    if args.compare:
+        flags = compare(results, baseline, args.threshold)
+        print('\n%d regression(s) against the baseline of %s'
+              % (len(flags), baseline.get('created', '?')))
+        for flag in flags:
+            print('  ' + flag)
+        return 1 if flags else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:21:37 2026
+
+@author: Zicong Huang
+
+benchmark cases
+
+each case maps a problem size to a function that runs the hot path once;
+building the inputs is setup and is not timed. Models and parameters are
+those of the numbered scripts
+"""
+
+import numpy as np
+
+def markov_chain_case(n):
+    '''markov.markov_chain of 5_sim_markov.py, n periods'''
+    from macro_model.markov import markov_chain
+    transition = np.array([[0.1, 0.5, 0.3, 0.1],
+                           [0.4, 0.2, 0.1, 0.3],
+                           [0.2, 0.3, 0.2, 0.3],
+                           [0.5, 0.2, 0.1, 0.2]])
+    V = [-1, 0, 1, 2]
+    return lambda: markov_chain(transition, n, 2, V, rng=np.random.default_rng(0))
+
+
+def doublej_case(m):
+    '''doublej.doublej on an (m x m) stable system, spectral radius 0.95'''
+    from macro_model.doublej import doublej
+    rng = np.random.default_rng(0)
+    q, _ = np.linalg.qr(rng.standard_normal((m, m)))
+    a = q @ np.diag(np.linspace(-0.95, 0.95, m)) @ q.T
+    b = rng.standard_normal((m, m))
+    b = b @ b.T / m
+    return lambda: doublej(a, b)
+
+
+def _det_grid(nk):
+    return np.linspace(0.001, 1, nk)
+
+
+def vfi_det_case(nk):
+    '''value function iteration of 10_det_dp.py on nk grid points'''
+    from macro_model.dp import bellman_operator, solve_vfi
+    alpha, beta, A = 0.35, 0.90, np.exp(0.40)
+    kgrid = _det_grid(nk)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cons = A * (kgrid[None,:]**alpha) - kgrid[:,None]
+        util = np.where(cons > 0, np.log(cons), -np.inf)
+    update = bellman_operator(util, beta)
+    return lambda: solve_vfi(update, np.zeros(nk), beta, tol=1e-7)
+
+
+def _stoch_model(nk):
+    alpha, beta, delta, sigma = 0.40, 0.60, 0.50, 2.00
+    A = np.array([1.25, 0.50])
+    prob = np.array([[0.8, 0.2], [0.2, 0.8]])
+    kgrid = np.linspace(0.01, 25.0, nk)
+    return alpha, beta, delta, sigma, A, prob, kgrid
+
+
+def vfi_stoch_case(nk):
+    '''value function iteration of 11_stoch_growth.py on nk grid points'''
+    from macro_model.dp import bellman_operator, solve_vfi
+    alpha, beta, delta, sigma, A, prob, kgrid = _stoch_model(nk)
+    kk = kgrid[None,:]
+    kkp = kgrid[:,None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cons = A[:,None,None] * (kk**alpha) + delta*kk - kkp
+        util = np.where(cons > 0, ((cons**(1-sigma)) - 1)/(1-sigma), -np.inf)
+    update = bellman_operator(util, beta, prob)
+    return lambda: solve_vfi(update, np.zeros((nk, len(A))), beta, prob, tol=1e-7)
+
+
+def stationary_case(nk):
+    '''stationary.stationary_distribution of a growth-model decision rule'''
+    from macro_model.stationary import stationary_distribution
+    alpha, beta, delta, sigma, A, prob, kgrid = _stoch_model(nk)
+    # save a constant share of resources, snapped to the grid
+    kprime = 0.4 * (np.outer(kgrid**alpha, A) + delta*kgrid[:,None])
+    decision = np.clip(np.searchsorted(kgrid, kprime), 0, nk-1)
+    return lambda: stationary_distribution(decision, prob, tol=1e-8)
+
+
+def panel_case(n_econ):
+    '''panel.simulate_panel of n_econ economies for 200 periods'''
+    from macro_model.panel import simulate_panel
+    alpha, beta, delta, sigma, A, prob, kgrid = _stoch_model(1000)
+    kprime = 0.4 * (np.outer(kgrid**alpha, A) + delta*kgrid[:,None])
+    decision = np.clip(np.searchsorted(kgrid, kprime), 0, len(kgrid)-1)
+    output = np.outer(kgrid**alpha, A)
+    return lambda: simulate_panel(decision, prob, kgrid, output, delta, T=200,
+                                  n_econ=n_econ, seed=0)
+
+
+def solow_case(T):
+    '''solow.simulate_solow of 6_solow.py for 100 saving rates, T periods'''
+    from macro_model.solow import simulate_solow
+    s = np.linspace(0.05, 0.5, 100)
+    return lambda: simulate_solow(T, s, 0.01, 0.10, 0.5, 26.8, K0=300, N0=5)
+
+
+# name -> (setup, problem sizes, what the size is)
+CASES = {
+    'markov_chain': (markov_chain_case, [10**4, 10**5, 10**6], 'periods'),
+    'doublej': (doublej_case, [10, 40, 160], 'matrix size'),
+    'vfi_det': (vfi_det_case, [250, 500, 1000], 'grid points'),
+    'vfi_stoch': (vfi_stoch_case, [250, 500, 1000], 'grid points'),
+    'stationary': (stationary_case, [10**3, 10**4, 10**5], 'grid points'),
+    'panel': (panel_case, [10**3, 10**4, 10**5], 'economies'),
+    'solow': (solow_case, [10**2, 10**3, 10**4], 'periods'),
+}
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:48:06 2026
+
+@author: Zicong Huang
+
+solvers and simulators behind the numbered scripts
+
+    solow       Solow, Mankiw-Romer-Weil and AK models
+    markov      Markov chains and AR(1) discretization
+    ar1         AR(1) simulation
+    dp          value function iteration, deterministic and stochastic
+    egm         endogenous grid method
+    stationary  stationary distribution of a decision rule
+    panel       panel simulation and moments of the growth model
+    doublej     discrete Lyapunov equations
+    convergence stopping rules and MacQueen-Porteus bounds for VFI
+    trace       convergence traces of the iterative solvers
+    timeseries  recession intervals and the HP filter
+    fred_data   FRED client and cache
+    table_cache columnar cache for spreadsheets
+    figures     headless figure rendering
+
+importing the package loads nothing but this file; each submodule is
+imported on first use of one of its names, e.g. macro_model.solve_vfi, and
+scipy, pandas, matplotlib and the FRED client only inside the functions
+that need them
+"""
+
+from importlib import import_module
+
+# public name -> submodule defining it
+_exports = {
+    'simulate_solow': 'solow', 'simulate_mrw': 'solow', 'simulate_ak': 'solow',
+    'steady_state': 'solow', 'steady_state_mrw': 'solow', 'find_crossing': 'solow',
+    'markov_chain': 'markov', 'markov_paths': 'markov', 'check_transition': 'markov',
+    'tauchen': 'markov', 'rouwenhorst': 'markov',
+    'simulate_ar1': 'ar1', 'ar1_chunks': 'ar1',
+    'bellman_operator': 'dp', 'bellman_monotone': 'dp', 'policy_step': 'dp',
+    'policy_value': 'dp', 'solve_vfi': 'dp', 'solve_multigrid': 'dp',
+    'solve_egm': 'egm',
+    'simulate_panel': 'panel',
+    'stationary_distribution': 'stationary', 'transition_matrix': 'stationary',
+    'solve_lyapunov': 'doublej', 'doublej': 'doublej',
+    'mqp_bounds': 'convergence', 'vfi_error': 'convergence',
+    'Trace': 'trace',
+    'indicator_intervals': 'timeseries', 'in_intervals': 'timeseries',
+    'hpfilter': 'timeseries', 'hpfilter_onesided': 'timeseries',
+    'RealTimeHP': 'timeseries',
+    'FredCache': 'fred_data', 'FredClient': 'fred_data',
+    'load_table': 'table_cache', 'load_usgdp': 'table_cache',
+    'FigureSpec': 'figures', 'render': 'figures',
+}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(import_module('.' + _exports[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:10:48 2026
+
+@author: Zicong Huang
+
+AR(1) simulation, x(t+1) = rho*x(t) + e(t+1)
+
+shocks are drawn in one call for a whole block of periods and series, and
+the recursion is run as the linear filter 1/(1 - rho L) over the block
+"""
+
+import numpy as np
+
+def draw_shocks(size, shocks='coin', rng=None):
+    '''
+    draws a block of shocks
+
+    Parameters
+    ----------
+    size : int or tuple
+        shape of the block
+    shocks : str or function
+        'coin' for +1/-1 with equal probability, 'normal' for standard
+        normal, or a function shocks(rng, size) returning an array of
+        that shape
+    rng : numpy.random.Generator, optional
+        source of randomness; a fresh default_rng() if None
+
+    Returns
+    -------
+    e : ndarray
+    '''
+    rng = np.random.default_rng() if rng is None else rng
+    if callable(shocks):
+        return np.asarray(shocks(rng, size), dtype=float)
+    if shocks == 'coin':
+        return 2.0*rng.integers(0, 2, size) - 1
+    if shocks == 'normal':
+        return rng.standard_normal(size)
+    raise ValueError("shocks must be 'coin', 'normal' or a function")
+
+
+def _filter(rho, e, last):
+    '''runs x(t) = rho*x(t-1) + e(t) along the last axis, from x(-1) = last'''
+    from scipy.signal import lfilter
+    x, _ = lfilter([1.0], [1.0, -rho], e, axis=-1, zi=(rho*last)[...,None])
+    return x
+
+
+def _draw_block(periods, lead, shocks, scale, rng):
+    '''draws period by period so the stream does not depend on the block size'''
+    return scale*np.moveaxis(draw_shocks((periods,) + lead, shocks, rng), 0, -1)
+
+
+def ar1_chunks(rho, T, chunk=2**20, n_series=None, shocks='coin', x0=0.0,
+               scale=1.0, rng=None):
+    '''
+    generates an AR(1) simulation block by block
+
+    only one block of shocks and paths is in memory at a time; the last
+    value of each block is carried over as the initial condition of the
+    next. With the same rng the blocks join up to the same paths as
+    simulate_ar1, whatever the block size
+
+    Parameters
+    ----------
+    rho : float
+        autoregressive coefficient
+    T : int
+        number of periods, including the initial one
+    chunk : int
+        number of periods per block
+    n_series : int, optional
+        number of independent series; None for a single series
+    shocks : str or function
+        shock distribution, see draw_shocks
+    x0 : float or array-like
+        initial value, common or one per series
+    scale : float
+        standard deviation (or size) multiplying each shock
+    rng : numpy.random.Generator, optional
+        source of randomness
+
+    Yields
+    ------
+    block : ndarray
+        the next periods of the simulation, (n_series x periods) or
+        (periods,) for a single series; the first block starts with x0
+    '''
+    rng = np.random.default_rng() if rng is None else rng
+    lead = () if n_series is None else (n_series,)
+    last = np.broadcast_to(np.asarray(x0, dtype=float), lead).copy()
+    if T <= 0:
+        return
+
+    # the initial value is the first period of the first block
+    done = 1
+    first = min(chunk, T) - 1
+    e = _draw_block(first, lead, shocks, scale, rng)
+    block = np.concatenate([last[...,None], _filter(rho, e, last)], axis=-1)
+    last = block[...,-1].copy()
+    yield block
+
+    while done + first < T:
+        done += first
+        first = min(chunk, T - done)
+        e = _draw_block(first, lead, shocks, scale, rng)
+        block = _filter(rho, e, last)
+        last = block[...,-1].copy()
+        yield block
+
+
+def simulate_ar1(rho, T, n_series=None, shocks='coin', x0=0.0, scale=1.0,
+                 rng=None):
+    '''
+    simulates AR(1) paths, all shocks drawn in one call
+
+    Parameters
+    ----------
+    rho : float
+        autoregressive coefficient
+    T : int
+        number of periods, including the initial one
+    n_series : int, optional
+        number of independent series; None for a single series
+    shocks : str or function
+        shock distribution, see draw_shocks
+    x0 : float or array-like
+        initial value, common or one per series
+    scale : float
+        standard deviation (or size) multiplying each shock
+    rng : numpy.random.Generator, optional
+        source of randomness
+
+    Returns
+    -------
+    x : ndarray
+        (n_series x T) paths, or (T,) for a single series
+    '''
+    lead = () if n_series is None else (n_series,)
+    blocks = list(ar1_chunks(rho, T, max(T, 1), n_series, shocks, x0, scale, rng))
+    return blocks[0] if blocks else np.empty(lead + (0,))
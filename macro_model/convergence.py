@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:30:41 2026
+
+@author: Zicong Huang
+
+stopping rules for value function iteration
+
+MacQueen-Porteus bounds: if tv = T v for a Bellman operator T with
+discount factor beta, the fixed point v* satisfies
+
+    tv + beta/(1-beta) min(tv - v) <= v* <= tv + beta/(1-beta) max(tv - v)
+
+state by state. The bracket is much narrower than the change tv - v when
+beta is close to 1, since a constant error in v only shifts tv, and the
+midpoint of the bracket is a far better estimate of v* than tv itself
+
+states where v or tv is -inf (no feasible choice) are left out of every
+criterion
+"""
+
+import numpy as np
+
+CRITERIA = ('relative', 'absolute')
+
+
+def check_criterion(criterion):
+    if criterion not in CRITERIA:
+        raise ValueError("criterion must be 'relative' or 'absolute'")
+
+
+def mqp_bounds(v, tv, beta):
+    '''
+    MacQueen-Porteus bounds on the fixed point, as shifts of tv
+
+    Parameters
+    ----------
+    v : ndarray
+        value function before the Bellman update
+    tv : ndarray
+        value function after it, T v
+    beta : float
+        discount factor, the modulus of T
+
+    Returns
+    -------
+    lower, upper : float
+        tv + lower <= v* <= tv + upper in every state
+    '''
+    finite = np.isfinite(v) & np.isfinite(tv)
+    if not finite.any():
+        return -np.inf, np.inf
+    change = (tv - v)[finite]
+    scale = beta/(1 - beta)
+    return scale*change.min(), scale*change.max()
+
+
+def vfi_error(v, tv, beta, criterion='relative', bounds=False):
+    '''
+    error of one value function iteration step
+
+    Parameters
+    ----------
+    v, tv : ndarray
+        value function before and after the Bellman update
+    beta : float
+        discount factor
+    criterion : str
+        'absolute' for the sup-norm of the error, 'relative' for the
+        sup-norm relative to the sup-norm of the value function, which is
+        well defined when v has zeros (e.g. an initial guess of zeros)
+    bounds : bool
+        measure the width of the MacQueen-Porteus bracket instead of the
+        change tv - v
+
+    Returns
+    -------
+    error : float
+        inf until the value function is finite somewhere
+    shift : float
+        constant to add to tv for the best estimate of the fixed point:
+        the bracket midpoint with bounds, 0 without
+    '''
+    finite = np.isfinite(v) & np.isfinite(tv)
+    if not finite.any():
+        return np.inf, 0.0
+    if bounds:
+        lower, upper = mqp_bounds(v, tv, beta)
+        error, shift = upper - lower, (lower + upper)/2
+        scale = np.max(np.abs(tv[finite] + shift))
+    else:
+        error, shift = np.max(np.abs((tv - v)[finite])), 0.0
+        scale = np.max(np.abs(v[finite]))
+    if criterion == 'relative':
+        error = error/scale if scale > 0 else (0.0 if error == 0 else np.inf)
+    return float(error), float(shift)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Dec 17 14:30:00 2020
+
+@author: jacob
+"""
+
+import sys
+import types
+import numpy as np
+
+def solve_lyapunov(A, Sigma, method='doubling', tol=1e-15, max_iter=100, callback=None):
+    '''
+    solves the discrete Lyapunov equation X = A X A' + Sigma for one pair
+    or a stack of pairs at once
+
+    Parameters
+    ----------
+    A : array-like
+        (n x n) matrix or (m x n x n) stack of matrices
+    Sigma : array-like
+        (n x n) matrix or (m x n x n) stack, broadcast against A
+    method : str
+        'doubling' iterates gamma <- gamma + alpha gamma alpha', alpha <- alpha^2
+        on the whole stack, freezing each pair once it has converged;
+        'kron' solves (I - A kron A) vec(X) = vec(Sigma), for small n;
+        'bartels-stewart' calls scipy.linalg.solve_discrete_lyapunov pair by pair
+    tol : float
+        doubling stops for a pair when max |gamma1 - gamma0| <= tol
+    max_iter : int
+        maximum number of doubling steps
+    callback : function, optional
+        called after every doubling step as callback('lyapunov', it,
+        error=..., active=...), the largest change of the pairs still
+        iterating and their number, and as callback('lyapunov', 0) before
+        the first; see trace.Trace
+
+    Returns
+    -------
+    X, info
+    X: solution(s), same leading shape as the broadcast inputs
+    info: dict of arrays, one entry per pair: 'iterations' (doubling steps,
+          0 for the direct methods), 'converged', and 'residual', the max
+          absolute entry of A X A' + Sigma - X
+    '''
+    A = np.asarray(A, dtype=float)
+    Sigma = np.asarray(Sigma, dtype=float)
+    single = A.ndim == 2 and Sigma.ndim == 2
+    A = A[None] if A.ndim == 2 else A
+    Sigma = Sigma[None] if Sigma.ndim == 2 else Sigma
+    A, Sigma = np.broadcast_arrays(A, Sigma)
+    m, n, n2 = A.shape
+    if n != n2 or Sigma.shape[1:] != (n, n):
+        raise ValueError('A and Sigma must be square matrices of the same size')
+
+    iterations = np.zeros(m, dtype=int)
+    if method == 'doubling':
+        alpha = A.copy()
+        gamma = Sigma.copy()
+        active = np.arange(m)
+        if callback is not None:
+            callback('lyapunov', 0)
+        with np.errstate(over='ignore', invalid='ignore'):
+            for it in range(1, max_iter+1):
+                a, g = alpha[active], gamma[active]
+                g1 = g + a @ g @ np.swapaxes(a, 1, 2)
+                diff = np.max(np.abs(g1 - g), axis=(1,2))
+                gamma[active] = g1
+                alpha[active] = a @ a
+                iterations[active] = it
+                if callback is not None:
+                    callback('lyapunov', it, error=float(np.max(diff)), active=len(active))
+                # keep iterating only on pairs that are still moving
+                active = active[~((diff <= tol) | ~np.isfinite(diff))]
+                if len(active) == 0:
+                    break
+        X = gamma
+    elif method == 'kron':
+        eye = np.eye(n*n)
+        lhs = eye - np.einsum('bij,bkl->bikjl', A, A).reshape((m, n*n, n*n))
+        X = np.linalg.solve(lhs, Sigma.reshape((m, n*n, 1))).reshape((m, n, n))
+    elif method == 'bartels-stewart':
+        from scipy.linalg import solve_discrete_lyapunov
+        X = np.stack([solve_discrete_lyapunov(a, s, method='bilinear')
+                      for a, s in zip(A, Sigma)])
+    else:
+        raise ValueError("method must be 'doubling', 'kron' or 'bartels-stewart'")
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        residual = np.max(np.abs(A @ X @ np.swapaxes(A, 1, 2) + Sigma - X), axis=(1,2))
+    converged = np.isfinite(residual)
+    if method == 'doubling':
+        converged &= np.isin(np.arange(m), active, invert=True)
+
+    info = {'iterations': iterations, 'converged': converged, 'residual': residual}
+    if single:
+        X = X[0]
+        info = {key: val[0] for key, val in info.items()}
+    return X, info
+
+
+def doublej(a1, b1, callback=None):
+    '''
+    computes sum_j a1^j b1 a1'^j by the doubling algorithm; raises
+    TimeoutError if it does not converge within 100 steps. callback is
+    passed to solve_lyapunov
+    '''
+    gamma1, info = solve_lyapunov(a1, b1, method='doubling', tol=1e-15, max_iter=99,
+                                  callback=callback)
+    if not info['converged']:
+        raise TimeoutError('Not converging, check your inputs')
+        
+    return gamma1
+
+
+class _CallableModule(types.ModuleType):
+    '''
+    macro_model.doublej names both this module and its doublej function;
+    importing the module rebinds the package attribute to it, so calling
+    the module calls the function and macro_model.doublej(a1, b1) works
+    either way
+    '''
+
+    def __call__(self, a1, b1, callback=None):
+        return doublej(a1, b1, callback)
+
+
+sys.modules[__name__].__class__ = _CallableModule
+
+'''
+it can be checked that doublej is identitcal to singlej
+'''
+
+# a1 = [[0.1,0.2,0.7],
+#       [0.3,0.3,0.4],
+#       [0.6,0.2,0.2]]
+
+# b1 = [[1,2,1],
+#       [2,1,3],
+#       [0,3,1]]
+
+# v, timer = doublej(a1, b1)
+
+# def singlej(a1, b1):
+#     alpha0 = np.matrix(a1)
+#     alpha1 = alpha0
+#     gamma0 = np.matrix(b1)
+#     diff = 5
+#     timer = 1
+    
+#     while diff > 1e-15:
+#         alpha1 = alpha1 * alpha0
+#         gamma1 = gamma0 + alpha0*gamma0*alpha0.T
+#         diff = abs((gamma1 - gamma0)).max()
+#         alpha0 = alpha1
+#         gamma0 = gamma1
+#         timer += 1
+#         if timer > 100 or diff == np.Inf:
+#             raise TimeoutError('Not converging, check your inputs')
+    
+#     return gamma1, timer
+
+# v2,timer2 = singlej(a1, b1)
+        
\ No newline at end of file
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:05:17 2026
+
+@author: Zicong Huang
+
+tools for solving the growth models by value function iteration
+
+utility is tabulated as in the scripts: util[i,j] is the period utility of
+choosing k' = kgrid[i] when capital today is k = kgrid[j]
+"""
+
+import numpy as np
+
+def bellman_operator(util, beta, prob=None):
+    '''
+    returns the Bellman update for a tabulated utility function
+
+    the update works in buffers allocated once here: the continuation value
+    is broadcast along the rows instead of being repeated into an nk x nk
+    matrix, and the maximized value is gathered at the argmax rather than
+    found by a second scan. With shocks, all shock states are handled by
+    one (ns x nk x nk') tensor: the expected continuation value is the
+    single product v @ prob.T and the max runs over the last axis
+
+    Parameters
+    ----------
+    util : ndarray
+        (nk' x nk) utility, util[i,j]: choose kgrid[i] with capital kgrid[j],
+        or (ns x nk' x nk) with util[a,i,j] the utility given shock a today
+    beta : float
+        subjective discount factor
+    prob : ndarray, optional
+        (ns x ns) shock transition, prob(a,b) = probability (A(t+1)=Ab|A(t)=Aa);
+        required when util has a shock dimension
+
+    Returns
+    -------
+    update : function
+        tv, tdecision = update(v), where without shocks
+        tv[j] = max_i util[i,j] + beta*v[i] and tdecision[j] is the argmax,
+        and with shocks v, tv and tdecision are (nk x ns) and
+        tv[j,a] = max_i util[a,i,j] + beta*sum_b prob(a,b) v[i,b].
+        The two output buffers alternate between calls, so the values
+        returned by one call stay valid through the next one
+    '''
+    util = np.asarray(util, dtype=float)
+    stochastic = util.ndim == 3
+    if stochastic and prob is None:
+        raise ValueError('prob is required when util has a shock dimension')
+    if not stochastic:
+        util = util[None]
+        prob = np.ones((1,1))
+    prob = np.asarray(prob, dtype=float)
+    # today's capital along the rows so that the max scans contiguous memory
+    util = np.ascontiguousarray(np.swapaxes(util, 1, 2))
+    ns, nk, nkp = util.shape
+    if prob.shape != (ns, ns):
+        raise ValueError('prob must be a square matrix with one row per shock state')
+
+    bellman = np.empty((ns, nk, nkp))
+    ev = np.empty((nkp, ns))
+    cont = np.empty((ns, 1, nkp))
+    flat = np.empty((ns, nk), dtype=np.intp)
+    offset = np.arange(ns*nk).reshape((ns, nk)) * nkp
+    tv = [np.empty((ns, nk)), np.empty((ns, nk))]
+    tdecision = [np.empty((ns, nk), dtype=np.intp), np.empty((ns, nk), dtype=np.intp)]
+    calls = [0]
+
+    def update(v):
+        which = calls[0] % 2
+        calls[0] += 1
+        np.matmul(np.reshape(v, (nkp, ns)), prob.T, out=ev)
+        np.multiply(ev.T, beta, out=cont[:,0,:])
+        np.add(util, cont, out=bellman)
+        np.argmax(bellman, axis=2, out=tdecision[which])
+        np.add(offset, tdecision[which], out=flat)
+        np.take(bellman, flat, out=tv[which])
+        if stochastic:
+            return tv[which].T, tdecision[which].T
+        return tv[which][0], tdecision[which][0]
+
+    return update
+
+
+def _monotone_levels(nk):
+    '''
+    visiting order for binary monotonicity: states are solved in rounds,
+    each state in a round being the midpoint between two states solved
+    earlier (or the ends of the grid, coded -1 and nk)
+    '''
+    levels = []
+    intervals = [(-1, nk)]
+    while intervals:
+        left = np.array([lo for lo, hi in intervals], dtype=np.intp)
+        right = np.array([hi for lo, hi in intervals], dtype=np.intp)
+        mid = (left + right) // 2
+        levels.append((mid, left, right))
+        intervals = [pair for lo, m, hi in zip(left, mid, right)
+                     for pair in ((lo, m), (m, hi)) if pair[1] - pair[0] > 1]
+    return levels
+
+
+def bellman_monotone(kgrid, resources, u, beta, prob=None):
+    '''
+    returns a Bellman update that exploits monotonicity and concavity
+
+    for growth models whose decision rule increases in k and whose
+    objective u(c) + beta*v(k') is concave in k', the optimum for a state
+    lies between the optima of its neighbours to the left and right, and
+    inside that bracket it is located by bisecting on the sign of the first
+    difference of the objective. States are solved in rounds of midpoints,
+    vectorized within a round and across shock states, so one update costs
+    O(nk log nk) per shock and never tabulates the nk x nk utility. Use
+    bellman_operator for models where these properties do not hold.
+
+    Parameters
+    ----------
+    kgrid : ndarray
+        increasing capital grid, both today and next period
+    resources : ndarray
+        resources available at each point of kgrid, c = resources - k';
+        (nk x ns) with col a for shock a today in a stochastic model
+    u : function
+        utility of consumption, applied elementwise to arrays
+    beta : float
+        subjective discount factor
+    prob : ndarray, optional
+        (ns x ns) shock transition matrix, required when resources has a
+        shock dimension
+
+    Returns
+    -------
+    update : function
+        tv, tdecision = update(v), with the same meaning as for
+        bellman_operator
+    '''
+    kgrid = np.asarray(kgrid, dtype=float)
+    resources = np.asarray(resources, dtype=float)
+    stochastic = resources.ndim == 2
+    if stochastic and prob is None:
+        raise ValueError('prob is required when resources has a shock dimension')
+    nk = len(kgrid)
+    resources = resources.reshape((nk, -1))
+    ns = resources.shape[1]
+    prob = np.ones((1,1)) if prob is None else np.asarray(prob, dtype=float)
+    if prob.shape != (ns, ns):
+        raise ValueError('prob must be a square matrix with one row per shock state')
+
+    # last choice that leaves positive consumption
+    imax = np.searchsorted(kgrid, resources.ravel(), side='left').reshape((nk, ns)) - 1
+    feasible = np.nonzero(imax >= 0)
+    # every round pairs each of its capital states with every shock state
+    levels = [(mid.repeat(ns), left.repeat(ns), right.repeat(ns), np.tile(np.arange(ns), len(mid)))
+              for mid, left, right in _monotone_levels(nk)]
+
+    def objective(i, j, a, ev):
+        return u(resources[j,a] - kgrid[i]) + beta*ev[i,a]
+
+    def update(v):
+        ev = np.reshape(v, (nk, ns)) @ prob.T    # expected next period value
+        tdecision = np.zeros((nk, ns), dtype=np.intp)
+        for mid, left, right, shock in levels:
+            lo = np.where(left >= 0, tdecision[np.maximum(left, 0), shock], 0)
+            hi = np.where(right < nk, tdecision[np.minimum(right, nk-1), shock], nk-1)
+            hi = np.minimum(hi, imax[mid, shock])
+            lo = np.minimum(lo, np.maximum(hi, 0))
+            # bisect on the sign of the first difference of the objective
+            active = np.flatnonzero(lo < hi)
+            while len(active):
+                j, a = mid[active], shock[active]
+                b0, b1 = lo[active], hi[active]
+                m = (b0 + b1) // 2
+                up = objective(m+1, j, a, ev) > objective(m, j, a, ev)
+                lo[active] = np.where(up, m+1, b0)
+                hi[active] = np.where(up, b1, m)
+                active = active[lo[active] < hi[active]]
+            tdecision[mid, shock] = lo
+
+        tv = np.full((nk, ns), -np.inf)
+        tv[feasible] = objective(tdecision[feasible], feasible[0], feasible[1], ev)
+        if stochastic:
+            return tv, tdecision
+        return tv[:,0], tdecision[:,0]
+
+    return update
+
+
+def policy_step(v, policy_util, decision, prob, beta, m=1):
+    '''
+    applies the Bellman equation for a fixed decision rule m times
+
+    v(k,a) <- u(k,a) + beta * sum_b prob(a,b) v(k'(k,a), b); only gathers
+    at the decision indices, no maximization
+
+    Parameters
+    ----------
+    v : ndarray
+        (nk x ns) value function
+    policy_util : ndarray
+        (nk x ns) period utility of following the decision rule
+    decision : ndarray of int
+        (nk x ns) indices of next period capital
+    prob : ndarray
+        (ns x ns) shock transition matrix
+    beta : float
+        subjective discount factor
+    m : int
+        number of applications
+
+    Returns
+    -------
+    v : ndarray
+        (nk x ns) updated value function
+    '''
+    for _ in range(m):
+        ev = v @ prob.T
+        v = policy_util + beta*np.take_along_axis(ev, decision, axis=0)
+    return v
+
+
+def policy_value(policy_util, decision, prob, beta):
+    '''
+    value of following a decision rule forever, from the sparse linear
+    system (I - beta*P) v = u, P being the transition over (capital, shock);
+    states where the rule yields -inf utility keep a value of -inf
+    '''
+    from scipy import sparse
+    from scipy.sparse.linalg import spsolve
+    from .stationary import transition_matrix
+
+    nk, ns = decision.shape
+    u = policy_util.flatten('F')
+    trans = transition_matrix(decision, prob)
+    finite = np.flatnonzero(np.isfinite(u))
+    trans = trans[finite][:,finite]
+    v = np.full(nk*ns, -np.inf)
+    v[finite] = spsolve(sparse.identity(len(finite), format='csc') - beta*trans.tocsc(), u[finite])
+    return v.reshape((nk, ns), order='F')
+
+
+def solve_vfi(update, v, beta, prob=None, tol=1e-7, max_iter=10000,
+              howard=0, max_howard=500, criterion='relative', bounds=False,
+              callback=None):
+    '''
+    iterates on Bellman's equation until the value function converges
+
+    Parameters
+    ----------
+    update : function
+        tv, tdecision = update(v); for a stochastic model v is (nk x ns)
+        (see bellman_operator), for a deterministic one a vector
+    v : ndarray
+        initial guess of the value function
+    beta : float
+        subjective discount factor
+    prob : ndarray, optional
+        (ns x ns) shock transition matrix; None for a deterministic model
+    tol : float
+        convergence criterion, see criterion and bounds
+    max_iter : int
+        maximum number of maximization steps
+    howard : int or str
+        policy iteration acceleration after each maximization step:
+        0 for plain value function iteration, an int m to apply the new
+        decision rule m more times, 'exact' to solve for its value by a
+        sparse linear solve, 'adaptive' to double the number of
+        applications (up to max_howard) while the decision rule stays the
+        same and go back to one application when it changes
+    max_howard : int
+        cap on the number of applications in the adaptive schedule
+    criterion : str
+        'relative' stops when max|tv-v| <= tol*max|v|, 'absolute' when
+        max|tv-v| <= tol; states without a feasible choice are ignored
+    bounds : bool
+        stop on the width of the MacQueen-Porteus bounds on the fixed
+        point instead of on tv-v, and return the midpoint of the bounds;
+        with beta close to 1 this takes far fewer iterations (see
+        convergence.py)
+    callback : function, optional
+        called after every maximization step as callback('vfi', it,
+        error=test, policy_changes=..., nk=...), policy_changes being the
+        number of states whose decision changed, and as callback('vfi', 0)
+        before the first; see trace.Trace
+
+    Returns
+    -------
+    v, decision, info
+    v: converged value function, same shape as the initial guess
+    decision: indices of the optimal k', same shape as v
+    info: dict with the number of maximization steps ('iterations'),
+          policy applications ('howard_steps'), 'converged' and the final
+          'error'
+    '''
+    from .convergence import check_criterion, vfi_error
+
+    check_criterion(criterion)
+    if not (howard in ('exact', 'adaptive') or (isinstance(howard, int) and howard >= 0)):
+        raise ValueError("howard must be a non-negative int, 'exact' or 'adaptive'")
+
+    shape = np.shape(v)
+    prob = np.ones((1,1)) if prob is None else np.asarray(prob, dtype=float)
+    as_matrix = lambda x: np.reshape(x, (shape[0], -1), order='F')
+
+    v = np.array(v, dtype=float)
+    decision = None
+    m = 1
+    howard_steps = 0
+    converged = False
+    if callback is not None:
+        callback('vfi', 0)
+    for it in range(1, max_iter+1):
+        tv, tdecision = update(v)
+        with np.errstate(invalid='ignore'):
+            test, shift = vfi_error(v, tv, beta, criterion, bounds)
+        if callback is not None:
+            changes = tdecision.size if decision is None else np.count_nonzero(tdecision != decision)
+            callback('vfi', it, error=test, policy_changes=int(changes), nk=shape[0])
+
+        if test <= tol:
+            # the bounds midpoint; 0 without bounds. tdecision is a buffer
+            # of update, which later calls overwrite
+            v, decision = tv + shift, np.array(tdecision)
+            converged = True
+            break
+
+        if howard:
+            # utility of the new rule: tv less the discounted continuation value
+            dec = as_matrix(tdecision)
+            ev = as_matrix(v) @ prob.T
+            with np.errstate(invalid='ignore'):
+                policy_util = as_matrix(tv) - beta*np.take_along_axis(ev, dec, axis=0)
+            policy_util[np.isneginf(as_matrix(tv))] = -np.inf
+            if howard == 'exact':
+                tv = policy_value(policy_util, dec, prob, beta)
+            else:
+                if howard == 'adaptive':
+                    same = decision is not None and np.array_equal(tdecision, decision)
+                    m = min(2*m, max_howard) if same else 1
+                else:
+                    m = howard
+                tv = policy_step(as_matrix(tv), policy_util, dec, prob, beta, m)
+                howard_steps += m
+            tv = np.reshape(tv, shape, order='F')
+
+        v, decision = tv, np.array(tdecision)
+
+    if not converged:
+        # without Howard steps v is still a buffer of update
+        v = np.array(v)
+    info = {'iterations': it, 'howard_steps': howard_steps, 'converged': converged,
+            'error': test}
+    return v, decision, info
+
+
+def interp_value(kgrid, v, kgrid_new):
+    '''
+    interpolates a value function onto a new capital grid, column by
+    column; points where v is -inf (no feasible choice) are skipped and
+    the value is held flat beyond the ends of the old grid
+    '''
+    v = np.asarray(v, dtype=float)
+    cols = v.reshape((len(kgrid), -1), order='F')
+    out = np.empty((len(kgrid_new), cols.shape[1]))
+    for a in range(cols.shape[1]):
+        finite = np.isfinite(cols[:,a])
+        out[:,a] = np.interp(kgrid_new, kgrid[finite], cols[finite,a])
+    return out.reshape((len(kgrid_new),) + v.shape[1:], order='F')
+
+
+def solve_multigrid(make_update, kgrids, v, beta, prob=None, tol=1e-7,
+                    tols=None, **kwargs):
+    '''
+    value function iteration from coarse to fine capital grids
+
+    the problem is solved on each grid in turn, the solution on one grid
+    interpolated onto the next as its initial guess. Coarse levels only
+    need to get close, so by default the tolerance is 10 times looser per
+    level above the finest
+
+    Parameters
+    ----------
+    make_update : function
+        make_update(kgrid) returns the Bellman update on that grid
+    kgrids : list of ndarray
+        capital grids from the coarsest to the finest
+    v : ndarray
+        initial guess of the value function on the coarsest grid
+    beta : float
+        subjective discount factor
+    prob : ndarray, optional
+        (ns x ns) shock transition matrix; None for a deterministic model
+    tol : float
+        convergence criterion on the finest grid
+    tols : list of float, optional
+        convergence criterion on each grid, overrides tol
+    **kwargs
+        passed on to solve_vfi, e.g. howard or callback; a callback sees
+        the iterations of every level, told apart by 'nk'
+
+    Returns
+    -------
+    v, decision, levels
+    v: converged value function on the finest grid
+    decision: indices of the optimal k' on the finest grid
+    levels: one dict per grid with 'nk', 'tol', 'iterations', 'converged'
+            and the wall-clock 'time' in seconds
+    '''
+    import time
+
+    if tols is None:
+        tols = [tol * 10**(len(kgrids)-1-i) for i in range(len(kgrids))]
+    if len(tols) != len(kgrids):
+        raise ValueError('tols must have one tolerance per grid')
+
+    levels = []
+    for i, (kgrid, level_tol) in enumerate(zip(kgrids, tols)):
+        start = time.perf_counter()
+        if i > 0:
+            v = interp_value(kgrids[i-1], v, kgrid)
+        update = make_update(kgrid)
+        v, decision, info = solve_vfi(update, v, beta, prob, tol=level_tol, **kwargs)
+        levels.append({'nk': len(kgrid), 'tol': level_tol,
+                       'iterations': info['iterations'],
+                       'converged': info['converged'],
+                       'time': time.perf_counter() - start})
+
+    return v, decision, levels
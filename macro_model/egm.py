@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:20:05 2026
+
+@author: Zicong Huang
+
+endogenous grid method (Carroll, 2006) for the stochastic growth model
+
+    max E Sum_t beta*({c_t}^{1-sigma}-1)/(1-sigma)
+    subject to:
+        c_t + k_{t+1} = A_t*{k_t}^alpha + delta*k_t
+        A_t ~ markov(prob)
+
+with the Euler equation
+
+    c_t^{-sigma} = beta * E_t[(alpha*A_{t+1}*k_{t+1}^{alpha-1} + delta) c_{t+1}^{-sigma}]
+
+kgrid is used as the grid of next period capital. For each k' and shock
+today the Euler equation gives consumption in closed form, and c + k' is
+the resources m = A*k^alpha + delta*k at which that choice is optimal.
+Consumption is carried as a function of resources, so no root finding and
+no maximization is needed
+"""
+
+import numpy as np
+
+def interp_columns(x, xp, fp):
+    '''
+    linear interpolation of every column of fp at the points in the same
+    column of x, extrapolating linearly past both ends of xp
+
+    Parameters
+    ----------
+    x : ndarray
+        (n x ns) points to evaluate
+    xp : ndarray
+        (m x ns) increasing data points, column by column
+    fp : ndarray
+        (m x ns) data values
+
+    Returns
+    -------
+    f : ndarray
+        (n x ns) interpolated values
+    '''
+    m, ns = xp.shape
+    # shift each column past the previous one so that one searchsorted
+    # call over the flattened points locates all columns at once
+    lo = min(xp.min(), x.min())
+    span = max(xp.max(), x.max()) - lo + 1
+    shift = span * np.arange(ns)
+    pos = np.searchsorted((xp - lo + shift).flatten('F'), (x - lo + shift).flatten('F'))
+    pos = pos.reshape(x.shape, order='F') - m * np.arange(ns)
+    pos = np.clip(pos, 1, m-1)
+
+    x0 = np.take_along_axis(xp, pos-1, axis=0)
+    x1 = np.take_along_axis(xp, pos, axis=0)
+    f0 = np.take_along_axis(fp, pos-1, axis=0)
+    f1 = np.take_along_axis(fp, pos, axis=0)
+    return f0 + (f1 - f0) * (x - x0) / (x1 - x0)
+
+
+def solve_egm(kgrid, alpha, beta, delta, sigma, A, prob, tol=1e-8, max_iter=5000,
+              callback=None):
+    '''
+    solves the stochastic growth model by the endogenous grid method
+
+    Parameters
+    ----------
+    kgrid : ndarray
+        increasing capital grid
+    alpha : float
+        capital share of income
+    beta : float
+        subjective discount factor
+    delta : float
+        1 - depreciation rate
+    sigma : float
+        coefficient of relative risk aversion, 1 for log utility
+    A : array-like
+        technology in each shock state, e.g. [A_high, A_low]
+    prob : ndarray
+        prob(a,b) = probability (A(t+1)=Ab|A(t)=Aa)
+    tol : float
+        convergence criterion, sup-norm change of consumption on kgrid
+    max_iter : int
+        maximum number of iterations
+    callback : function, optional
+        called every iteration as callback('egm', it, error=test,
+        constrained=...), constrained being the number of states where
+        the borrowing constraint k' = kgrid[0] binds, and as
+        callback('egm', 0) before the first; see trace.Trace
+
+    Returns
+    -------
+    kprime, cons, info
+    kprime: (nk x ns) next period capital at each point of kgrid, col a:
+            shock a this period; not restricted to grid points
+    cons: (nk x ns) consumption
+    info: dict with the number of 'iterations', 'converged' and the final
+          sup-norm change 'error'
+    '''
+    kgrid = np.asarray(kgrid, dtype=float)
+    A = np.asarray(A, dtype=float)
+    prob = np.asarray(prob, dtype=float)
+    k = kgrid[:,None]
+
+    # resources and gross return on capital at each (k, A)
+    resources = A * (k**alpha) + delta*k
+    gross_return = alpha * A * (k**(alpha-1)) + delta
+
+    # initial guess: save the least possible
+    m_endog = resources.copy()
+    c_endog = resources - kgrid[0]
+
+    cons = np.full(resources.shape, np.inf)
+    converged = False
+    if callback is not None:
+        callback('egm', 0)
+    for it in range(1, max_iter+1):
+        # consumption at resources m = A k^alpha + delta k; below the
+        # endogenous grid the choice k' = kgrid[0] binds
+        tcons = interp_columns(resources, m_endog, c_endog)
+        constrained = resources < m_endog[0]
+        tcons[constrained] = (resources - kgrid[0])[constrained]
+
+        test = np.max(np.abs(tcons - cons))
+        cons = tcons
+        if callback is not None:
+            callback('egm', it, error=float(test), constrained=int(np.count_nonzero(constrained)))
+        if test <= tol:
+            converged = True
+            break
+
+        # Euler equation at every k' on kgrid and every shock today at once
+        expected = (gross_return * cons**(-sigma)) @ prob.T
+        c_endog = (beta * expected)**(-1/sigma)
+        m_endog = c_endog + k
+
+    kprime = resources - cons
+    info = {'iterations': it, 'converged': converged, 'error': float(test)}
+    return kprime, cons, info
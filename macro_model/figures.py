@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:12:50 2026
+
+@author: Zicong Huang
+
+headless figure rendering from figure specs
+
+a FigureSpec records the calls a script would make on a matplotlib Axes,
+with the arrays they plot, and does no drawing itself. render() replays the
+specs on Agg figures across a process pool and writes image files. Each
+file is cached under a hash of its spec (calls, arrays, size, dpi), so a
+figure is drawn again only when something that goes into it has changed
+"""
+
+import os
+import json
+import types
+import pickle
+import hashlib
+import numpy as np
+
+def default_figure_dir():
+    '''$FIGURE_DIR, or ./figures'''
+    return os.environ.get('FIGURE_DIR', 'figures')
+
+
+class _Recorder:
+    '''records a call to the Axes attribute at path'''
+
+    def __init__(self, calls, path):
+        self._calls = calls
+        self._path = path
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return _Recorder(self._calls, self._path + (attr,))
+
+    def __call__(self, *args, **kwargs):
+        self._calls.append((self._path, args, kwargs))
+
+
+class FigureSpec:
+    '''
+    recipe for a one-axes figure
+
+    every Axes method called on the spec is recorded for render(), with its
+    arguments; attributes chain, e.g. spec.yaxis.set_major_formatter(f).
+    Arguments that cannot be pickled, e.g. FuncFormatter(lambda ...), are
+    hashed by their code, and their specs are drawn in the calling process.
+    pyplot helpers map to the Axes methods of the same purpose:
+    plt.xticks -> spec.set_xticks, plt.hlines -> spec.hlines,
+    plt.axis -> spec.axis
+
+    Parameters
+    ----------
+    name : str
+        file name of the figure, without extension
+    figsize : tuple
+        width and height in inches
+    dpi : int
+        resolution of the final render
+
+    Examples
+    --------
+    >>> spec = FigureSpec('capital')
+    >>> spec.plot(year, K_N)
+    >>> spec.set_title('simulated path of the capital-to-labor ratio')
+    >>> render([spec])
+    '''
+
+    def __init__(self, name, figsize=(10,6), dpi=300):
+        self.name = name
+        self.figsize = tuple(figsize)
+        self.dpi = dpi
+        self.calls = []
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return _Recorder(self.calls, (attr,))
+
+    def digest(self, dpi, fmt):
+        '''hash of everything that goes into the rendered file'''
+        import matplotlib
+        h = hashlib.sha256()
+        _update_hash(h, (self.figsize, dpi, fmt, matplotlib.__version__, self.calls))
+        return h.hexdigest()
+
+
+def _update_hash(h, obj, depth=0):
+    '''
+    feeds obj to the hash, arrays by dtype, shape and raw bytes, other
+    objects by their pickle, or by _update_unpicklable if they have none
+    '''
+    if type(obj).__module__.startswith('pandas') and hasattr(obj, 'index'):
+        # Series and DataFrames plot against their index
+        _update_hash(h, (type(obj).__name__, np.asarray(obj.index),
+                         list(getattr(obj, 'columns', [])), np.asarray(obj)))
+    elif isinstance(obj, np.ndarray) or type(obj).__module__.startswith('pandas'):
+        array = np.ascontiguousarray(np.asarray(obj))
+        if array.dtype.hasobject:
+            h.update(pickle.dumps(array.tolist()))
+        else:
+            h.update(('%s%s' % (array.dtype.str, array.shape)).encode())
+            h.update(array.tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[%d' % len(obj))
+        for item in obj:
+            _update_hash(h, item, depth)
+        h.update(b']')
+    elif isinstance(obj, dict):
+        h.update(b'{%d' % len(obj))
+        for key in sorted(obj, key=str):
+            _update_hash(h, key, depth)
+            _update_hash(h, obj[key], depth)
+        h.update(b'}')
+    elif isinstance(obj, (str, bytes, int, float, complex, bool, type(None), np.generic)):
+        h.update(repr(obj).encode())
+    else:
+        try:
+            h.update(pickle.dumps(obj))
+        except Exception:
+            _update_unpicklable(h, obj, depth)
+
+
+def _update_unpicklable(h, obj, depth):
+    '''
+    feeds an object without a pickle to the hash, e.g. a lambda or a
+    FuncFormatter holding one: functions by their code, constants, defaults
+    and closure, other objects by their type and attributes. Deep or
+    cyclic structures end in repr(), which may hold an address and so only
+    cost a redraw
+    '''
+    h.update(b'<%s.%s' % (type(obj).__module__.encode(), type(obj).__qualname__.encode()))
+    if depth > 8:
+        h.update(repr(obj).encode())
+    elif isinstance(obj, types.CodeType):
+        h.update(obj.co_code)
+        _update_hash(h, (obj.co_names, obj.co_consts), depth + 1)
+    elif isinstance(obj, types.FunctionType):
+        cells = [cell.cell_contents for cell in obj.__closure__ or ()]
+        _update_hash(h, (obj.__module__, obj.__qualname__, obj.__code__,
+                         obj.__defaults__, obj.__kwdefaults__, cells), depth + 1)
+    elif hasattr(obj, '__dict__'):
+        _update_hash(h, vars(obj), depth + 1)
+    else:
+        h.update(repr(obj).encode())
+    h.update(b'>')
+
+
+def draw(spec, dpi=None):
+    '''
+    replays a spec on a new Agg figure, without pyplot
+
+    Returns
+    -------
+    fig : matplotlib.figure.Figure
+    '''
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=spec.figsize, dpi=spec.dpi if dpi is None else dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    for path, args, kwargs in spec.calls:
+        target = ax
+        for attr in path:
+            target = getattr(target, attr)
+        target(*args, **kwargs)
+    return fig
+
+
+def _picklable(obj):
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def _render_one(spec, path, dpi, fmt):
+    fig = draw(spec, dpi)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        fig.savefig(f, format=fmt, dpi=dpi)
+    os.replace(tmp, path)
+    return path
+
+
+def render(specs, out_dir=None, fmt='png', preview=None, preview_dpi=60,
+           workers=None, force=False):
+    '''
+    renders figure specs to image files, skipping unchanged figures
+
+    Parameters
+    ----------
+    specs : list of FigureSpec
+        figures to render; names must be unique
+    out_dir : str, optional
+        output directory, default_figure_dir() if None
+    fmt : str
+        image format, e.g. 'png', 'pdf' or 'svg'
+    preview : bool, optional
+        render at preview_dpi to name.preview.fmt instead of the spec dpi;
+        if None, preview when the FIGURE_PREVIEW environment variable is 1
+    preview_dpi : int
+        resolution of previews
+    workers : int, optional
+        processes drawing figures in parallel; os.cpu_count() if None,
+        1 draws in this process
+    force : bool
+        redraw even when the cached file is up to date
+
+    Returns
+    -------
+    paths : list of str
+        file of each spec, in order
+    '''
+    out_dir = default_figure_dir() if out_dir is None else out_dir
+    if preview is None:
+        preview = os.environ.get('FIGURE_PREVIEW', '0') == '1'
+    names = [spec.name for spec in specs]
+    if len(set(names)) != len(names):
+        raise ValueError('figure names must be unique')
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest_path = os.path.join(out_dir, '.render_cache.json')
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    jobs = []
+    paths = []
+    for spec in specs:
+        dpi = preview_dpi if preview else spec.dpi
+        file = '%s%s.%s' % (spec.name, '.preview' if preview else '', fmt)
+        path = os.path.join(out_dir, file)
+        key = spec.digest(dpi, fmt)
+        paths.append(path)
+        if force or manifest.get(file) != key or not os.path.exists(path):
+            jobs.append((spec, path, dpi, fmt, file, key))
+
+    workers = os.cpu_count() if workers is None else workers
+    local, remote = jobs, []
+    if workers > 1 and len(jobs) > 1:
+        # specs that cannot be sent to a worker (e.g. holding a lambda)
+        # are drawn in this process
+        local, remote = [], []
+        for job in jobs:
+            (remote if _picklable(job[0]) else local).append(job)
+    if len(remote) == 1:
+        local, remote = local + remote, []
+    futures = []
+    pool = None
+    if remote:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(remote)))
+        futures = [pool.submit(_render_one, spec, path, dpi, fmt)
+                   for spec, path, dpi, fmt, _, _ in remote]
+    try:
+        for spec, path, dpi, fmt, _, _ in local:
+            _render_one(spec, path, dpi, fmt)
+        for future in futures:
+            future.result()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if jobs:
+        manifest.update({file: key for _, _, _, _, file, key in jobs})
+        tmp = manifest_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, manifest_path)
+    return paths
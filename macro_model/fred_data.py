@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:25:41 2026
+
+@author: Zicong Huang
+
+on-disk cache and concurrent client for the FRED API
+
+each series is stored as one .npz file of columns (observation dates and
+values) named after the series id, the requested date range, a hash of any
+other query parameters (units, frequency, ...) and the time it was fetched
+from FRED. A cached series is served while it is younger than
+the ttl; in offline mode it is served whatever its age and FRED is never
+contacted
+"""
+
+import os
+import glob
+import json
+import time
+import hashlib
+import threading
+import warnings
+import http.client
+import urllib.parse
+import numpy as np
+
+def default_cache_dir():
+    '''$FRED_CACHE_DIR, or ~/.cache/macro_model/fred'''
+    return os.environ.get('FRED_CACHE_DIR',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'macro_model', 'fred'))
+
+
+def _date_key(date):
+    if date is None:
+        return 'none'
+    import pandas as pd
+    return pd.Timestamp(date).strftime('%Y-%m-%d')
+
+
+class FredClient:
+    '''
+    thread-safe client for FRED series observations
+
+    each thread keeps one persistent HTTP connection, all threads share one
+    rate limit, and failed requests (connection errors, 429 and 5xx
+    responses) are retried with exponential backoff
+
+    Parameters
+    ----------
+    api_key : str, optional
+        FRED api key, read from the FRED_API_KEY environment variable if None
+    root_url : str
+        base url of the API; point it at a local server for tests
+    requests_per_minute : float
+        rate limit shared by all threads; FRED allows 120
+    retries : int
+        number of retries of a failed request
+    backoff : float
+        seconds before the first retry, doubled for every further one
+    timeout : float
+        socket timeout in seconds
+    '''
+
+    def __init__(self, api_key=None, root_url='https://api.stlouisfed.org/fred',
+                 requests_per_minute=120, retries=4, backoff=0.5, timeout=30):
+        self.api_key = os.environ.get('FRED_API_KEY') if api_key is None else api_key
+        url = urllib.parse.urlsplit(root_url)
+        self._https = url.scheme == 'https'
+        self._host = url.netloc
+        self._path = url.path.rstrip('/')
+        self.interval = 60/requests_per_minute
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            connection = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            conn = connection(self._host, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def _wait_turn(self):
+        '''books the next free request slot and sleeps until it'''
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _get(self, endpoint, params):
+        query = urllib.parse.urlencode(dict(params, api_key=self.api_key, file_type='json'))
+        url = '%s/%s?%s' % (self._path, endpoint, query)
+        for attempt in range(self.retries + 1):
+            self._wait_turn()
+            try:
+                conn = self._connection()
+                conn.request('GET', url)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as err:
+                self._drop_connection()
+                error = err
+            else:
+                if response.status == 200:
+                    return json.loads(body)
+                error = ConnectionError('FRED returned %d for %s: %s'
+                                        % (response.status, params.get('series_id'), body[:200]))
+                if response.status != 429 and response.status < 500:
+                    raise error
+            if attempt < self.retries:
+                time.sleep(self.backoff * 2**attempt)
+        raise error
+
+    def get_series(self, series_id, observation_start=None, observation_end=None, **kwargs):
+        '''
+        returns a FRED series as a pandas Series indexed by date, missing
+        observations as nan; extra keyword arguments (e.g. units='pch',
+        frequency='a', aggregation_method='eop') are passed to FRED as query
+        parameters, as in fredapi
+        '''
+        import pandas as pd
+
+        params = dict(kwargs, series_id=series_id)
+        if observation_start is not None:
+            params['observation_start'] = _date_key(observation_start)
+        if observation_end is not None:
+            params['observation_end'] = _date_key(observation_end)
+        observations = self._get('series/observations', params)['observations']
+        index = pd.to_datetime([obs['date'] for obs in observations])
+        values = pd.to_numeric([obs['value'] for obs in observations], errors='coerce')
+        return pd.Series(values, index=index, name=series_id, dtype=float)
+
+
+class FredCache:
+    '''
+    drop-in replacement for fredapi.Fred().get_series with a disk cache
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        directory of the cached files, default_cache_dir() if None
+    ttl : float, optional
+        seconds a cached series stays fresh; None never expires
+    offline : bool, optional
+        serve only from the cache, raise LookupError for missing series;
+        if None, offline when the FRED_OFFLINE environment variable is 1
+    fred : object, optional
+        client with a fredapi-style get_series method, e.g. fredapi.Fred()
+        or a stand-in for tests; a FredClient(api_key) is created on first
+        use if None
+    api_key : str, optional
+        FRED api key for the default client, read from the FRED_API_KEY
+        environment variable if None
+    '''
+
+    def __init__(self, cache_dir=None, ttl=24*3600, offline=None, fred=None, api_key=None):
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.ttl = ttl
+        if offline is None:
+            offline = os.environ.get('FRED_OFFLINE', '0') == '1'
+        self.offline = offline
+        self.api_key = api_key
+        self._fred = fred
+        self._lock = threading.Lock()
+
+    def client(self):
+        # one client for all threads, so that they share its rate limit
+        with self._lock:
+            if self._fred is None:
+                self._fred = FredClient(api_key=self.api_key)
+        return self._fred
+
+    def _stem(self, series_id, observation_start, observation_end, kwargs=None):
+        parts = [series_id, _date_key(observation_start), _date_key(observation_end)]
+        if kwargs:
+            query = json.dumps(sorted(kwargs.items()), default=str)
+            parts.append(hashlib.sha256(query.encode()).hexdigest()[:12])
+        return '__'.join(parts)
+
+    def _cached(self, stem):
+        '''paths and fetch times of the cached copies of a series, newest last'''
+        found = []
+        for path in glob.glob(os.path.join(glob.escape(self.cache_dir), stem + '__*.npz')):
+            fetched = os.path.basename(path)[len(stem)+2:-4]
+            if fetched.isdigit():
+                found.append((int(fetched), path))
+        return sorted(found)
+
+    def _read(self, path, series_id):
+        import pandas as pd
+        with np.load(path) as data:
+            index = pd.to_datetime(data['date'])
+            return pd.Series(data['value'], index=index, name=series_id)
+
+    def _write(self, stem, series, fetched):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, '%s__%d.npz' % (stem, fetched))
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, date=np.asarray(series.index.values, dtype='datetime64[ns]'),
+                     value=np.asarray(series.values, dtype=float))
+        os.replace(tmp, path)
+        return path
+
+    def get_series(self, series_id, observation_start=None, observation_end=None, **kwargs):
+        '''
+        returns a FRED series as a pandas Series indexed by date, from the
+        cache when possible; extra keyword arguments (e.g. units, frequency)
+        are FRED query parameters, passed to the client, and are part of the
+        cache key
+        '''
+        stem = self._stem(series_id, observation_start, observation_end, kwargs)
+        cached = self._cached(stem)
+        now = int(time.time())
+
+        if cached:
+            fetched, path = cached[-1]
+            if self.offline or self.ttl is None or now - fetched < self.ttl:
+                return self._read(path, series_id)
+        if self.offline:
+            raise LookupError('%s is not in the FRED cache at %s' % (series_id, self.cache_dir))
+
+        try:
+            series = self.client().get_series(series_id, observation_start=observation_start,
+                                              observation_end=observation_end, **kwargs)
+        except Exception as err:
+            if not cached:
+                raise
+            warnings.warn('could not fetch %s from FRED (%s), using the copy cached at %s'
+                          % (series_id, err, time.ctime(cached[-1][0])))
+            return self._read(cached[-1][1], series_id)
+
+        path = self._write(stem, series, now)
+        for _, old in cached:
+            if old != path:
+                os.remove(old)
+        series.name = series_id
+        return series
+
+    def get_many(self, series_ids, observation_start=None, observation_end=None,
+                 max_workers=8, **kwargs):
+        '''
+        returns many series as one DataFrame, one column per series id,
+        aligned on the union of their dates. Series missing from the cache
+        (or stale) are fetched concurrently by a pool of max_workers threads;
+        extra keyword arguments are FRED query parameters, as in get_series
+        '''
+        import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
+
+        series_ids = list(series_ids)
+        fetch = lambda series_id: self.get_series(series_id, observation_start, observation_end,
+                                                  **kwargs)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(series_ids)))) as pool:
+            series = list(pool.map(fetch, series_ids))
+        if not series:
+            return pd.DataFrame()
+        return pd.concat(series, axis=1, keys=series_ids, sort=True)
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Dec 16 21:50:48 2020
+
+@author: Zicong Huang
+"""
+import numpy as np
+from functools import lru_cache
+from math import sqrt
+
+# markov_indices tabulates successors for chains of at most TABLE_STATES
+# states, in blocks of at most TABLE_SIZE table entries
+TABLE_STATES = 24
+TABLE_SIZE = 2**20
+
+
+def check_transition(T):
+    '''
+    validates a transition matrix and returns it as a float array
+
+    Parameters
+    ----------
+    T : array-like object
+        transition matrix
+
+    Returns
+    -------
+    T : ndarray
+        the transition matrix as a 2-d float array
+    '''
+    T = np.array(T)
+    # check if T is square matrix
+    if T.ndim != 2:
+        raise ValueError('Transition matrix should be squared')
+    row,col = T.shape
+    if row != col:
+        raise ValueError('Transition matrix should be squared')
+    # check if T has more than 1 dims
+    if row < 2:
+        raise ValueError('Transition matrix must have more than 2 dimensions')
+    # check if all elements numeric
+    try:
+        rowsum = np.sum(T, axis=1)
+    except TypeError:
+        raise TypeError('Transition matrix contains numeric elements only')
+    # check if rowwise summation are 1
+    if not np.allclose(rowsum, 1):
+        raise ValueError('Each row of the transition matrix must sum to 1')
+
+    return T.astype(float)
+
+
+def cumulative_transition(T):
+    '''
+    tabulates the conditional cdf of next period's state once
+
+    Parameters
+    ----------
+    T : ndarray
+        validated transition matrix
+
+    Returns
+    -------
+    cum_prob : ndarray
+        cum_prob[i,j] = prob(s(t+1) <= j | s(t) = i); the last column is
+        pinned to 1 so round-off never pushes a draw past the last state
+    '''
+    cum_prob = np.cumsum(T, axis=1)
+    cum_prob[:,-1] = 1
+    return cum_prob
+
+
+def markov_indices(T, n=200, s0=0, rng=None, chunk=65536):
+    '''
+    simulates the path of state indices of a Markov chain
+
+    the next state is drawn by inverse-cdf sampling: with x ~ U(0,1), the
+    next state is the first j such that x <= cum_prob[s,j]. With few states,
+    the successor of every state for every draw of a block is found with one
+    searchsorted call per row, so the only per-period work left is an
+    integer lookup. That table costs time and memory in proportion to the
+    number of states, so with more than TABLE_STATES states each period
+    searches only the row of the current state instead.
+
+    Parameters
+    ----------
+    T : array-like object
+        transition matrix
+    n : int
+        number of periods to simulate
+    s0 : int
+        position of the initial state
+    rng : numpy.random.Generator, optional
+        source of uniform draws; the global np.random state is used if None
+    chunk : int
+        number of periods drawn at once; the lookup table of a block holds
+        at most TABLE_SIZE entries, so blocks are shorter with more states
+
+    Returns
+    -------
+    path : ndarray of int
+        simulated state indices, path[0] = s0
+    '''
+    T = check_transition(T)
+    cum_prob = cumulative_transition(T)
+    row = T.shape[0]
+    if not 0 <= s0 < row:
+        raise ValueError('Initial state must be a valid state index')
+
+    draw = np.random.random_sample if rng is None else rng.random
+    path = np.empty(n, dtype=np.intp)
+    if n == 0:
+        return path
+
+    s = int(s0)
+    path[0] = s
+    use_table = row <= TABLE_STATES
+    if use_table:
+        chunk = max(1, min(chunk, TABLE_SIZE // row))
+    for start in range(1, n, chunk):
+        stop = min(start + chunk, n)
+        x = draw(stop - start)
+        block = [0] * (stop - start)
+        if use_table:
+            # successor of every state for every draw in this block
+            successor = [np.searchsorted(cum_prob[i], x).tolist() for i in range(row)]
+            for k in range(stop - start):
+                s = successor[s][k]
+                block[k] = s
+        else:
+            search = [cum_prob[i].searchsorted for i in range(row)]
+            for k, xk in enumerate(x.tolist()):
+                s = int(search[s](xk))
+                block[k] = s
+        path[start:stop] = block
+
+    return path
+
+
+def onehot_states(path, n_states):
+    '''
+    expands an index path to the (n_states x n) matrix of state vectors
+    '''
+    state = np.zeros((n_states, len(path)))
+    state[path, np.arange(len(path))] = 1
+    return state
+
+
+def markov_chain(T, n=200, s0=0, V=None, onehot=False, rng=None):
+    '''
+    generates a simulation from a Markov chain of dimension the size of T
+
+    Parameters
+    ----------
+    T : array-like object
+        transition matrix
+    n : int
+        number of periods to simulate
+    s0 : int
+        position of the initial state
+    V : vector
+        quantitive corresponding to each state; the state index is used
+        if None
+    onehot : bool
+        if True, return the state vectors (one column per period) instead of
+        the state indices
+    rng : numpy.random.Generator, optional
+        source of uniform draws; the global np.random state is used if None
+
+    Returns
+    -------
+    chain, state
+    chain: simulated markov chain
+    state: simulated state indices, or state vectors if onehot is True
+    '''
+    T = check_transition(T)
+    path = markov_indices(T, n, s0, rng)
+
+    if V is None:
+        chain = path.astype(float)
+    else:
+        V = np.array(V, dtype=float)
+        if V.shape != (T.shape[0],):
+            raise ValueError('V must have one value per state')
+        chain = V[path]
+
+    if onehot:
+        return chain, onehot_states(path, T.shape[0])
+    return chain, path
+
+
+def _simulate_block(cum_prob, n, s0, seed):
+    '''
+    simulates one block of paths from its own seed; a module-level function
+    so that it can be sent to worker processes
+    '''
+    rng = np.random.default_rng(seed)
+    n_paths = len(s0)
+    # the last column of cum_prob is 1, so a draw never exceeds it
+    thresholds = np.ascontiguousarray(cum_prob[:,:-1])
+    # fill period by period into a time-major buffer, transpose on return
+    paths = np.empty((n, n_paths), dtype=np.min_scalar_type(cum_prob.shape[0] - 1))
+    if n == 0:
+        return paths.T
+
+    s = s0.astype(np.intp)
+    paths[0] = s
+    x = np.empty(n_paths)
+    for t in range(1, n):
+        rng.random(out=x)
+        # number of conditional cdf values below the draw is the next state
+        s = np.count_nonzero(x[:,None] > thresholds[s], axis=1)
+        paths[t] = s
+
+    return paths.T
+
+
+def markov_paths(T, n=200, n_paths=1000, s0=0, seed=None, workers=1, block=4096):
+    '''
+    simulates many independent paths of the same Markov chain at once
+
+    paths are cut into blocks of at most `block` paths and every block gets
+    its own child of SeedSequence(seed). The draws of a block therefore do
+    not depend on which process simulates it, and the result is the same
+    for any number of workers.
+
+    Parameters
+    ----------
+    T : array-like object
+        transition matrix
+    n : int
+        number of periods to simulate
+    n_paths : int
+        number of paths to simulate
+    s0 : int or array-like of int
+        initial state, common to all paths or one per path
+    seed : int, SeedSequence, Generator or None
+        root seed of the simulation; for a Generator, the SeedSequence it
+        was created from, so every call spawns fresh children of it
+    workers : int
+        number of worker processes; 1 simulates in this process
+    block : int
+        number of paths per seeded block
+
+    Returns
+    -------
+    paths : ndarray
+        (n_paths x n) matrix of state indices, stored in the smallest
+        unsigned integer type that holds all states
+    '''
+    T = check_transition(T)
+    cum_prob = cumulative_transition(T)
+    row = T.shape[0]
+
+    s0 = np.broadcast_to(np.asarray(s0, dtype=np.intp), (n_paths,))
+    if np.any((s0 < 0) | (s0 >= row)):
+        raise ValueError('Initial state must be a valid state index')
+
+    if isinstance(seed, np.random.Generator):
+        seed = seed.bit_generator.seed_seq
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    starts = range(0, n_paths, block)
+    seeds = seed.spawn(len(starts))
+    jobs = [(cum_prob, n, s0[i:i+block], ss) for i, ss in zip(starts, seeds)]
+
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(_simulate_block, *zip(*jobs)))
+    else:
+        blocks = [_simulate_block(*job) for job in jobs]
+
+    if not blocks:
+        return np.empty((0, n), dtype=np.min_scalar_type(row - 1))
+    return np.concatenate(blocks, axis=0)
+
+
+def _readonly(*arrays):
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=128)
+def _tauchen(rho, sigma, n, m, mu):
+    from scipy.special import ndtr
+    std_y = sigma/sqrt(1 - rho**2)
+    grid = np.linspace(-m*std_y, m*std_y, n)
+    step = grid[1] - grid[0]
+    # z(j) - rho*z(i) for every pair of states, standardized
+    gap = (grid[None,:] - rho*grid[:,None])/sigma
+    upper = ndtr(gap + step/(2*sigma))
+    lower = ndtr(gap - step/(2*sigma))
+    T = upper - lower
+    T[:,0] = upper[:,0]
+    T[:,-1] = 1 - lower[:,-1]
+    return _readonly(grid + mu/(1 - rho), T)
+
+
+def tauchen(rho, sigma, n=7, m=3, mu=0.0):
+    '''
+    discretizes y(t+1) = mu + rho*y(t) + e(t+1), e ~ N(0, sigma^2), by
+    Tauchen's method
+
+    Parameters
+    ----------
+    rho : float
+        autoregressive coefficient, |rho| < 1
+    sigma : float
+        standard deviation of the innovation
+    n : int
+        number of states
+    m : float
+        the grid spans m unconditional standard deviations around the mean
+    mu : float
+        constant of the process
+
+    Returns
+    -------
+    grid, T
+    grid: evenly spaced states of y
+    T: transition matrix, T(i,j) = probability (y(t+1)=grid(j)|y(t)=grid(i))
+
+    results are cached by parameters and returned read-only; copy them
+    before modifying
+    '''
+    if n < 2:
+        raise ValueError('Discretization needs at least 2 states')
+    return _tauchen(float(rho), float(sigma), int(n), float(m), float(mu))
+
+
+@lru_cache(maxsize=128)
+def _rouwenhorst(rho, sigma, n, mu):
+    p = (1 + rho)/2
+    T = np.array([[p, 1-p], [1-p, p]])
+    for size in range(3, n+1):
+        # the recursion of Rouwenhorst (1995), all four corners at once
+        padded = np.zeros((4, size, size))
+        padded[0,:-1,:-1] = T
+        padded[1,:-1,1:] = T
+        padded[2,1:,:-1] = T
+        padded[3,1:,1:] = T
+        T = np.tensordot([p, 1-p, 1-p, p], padded, axes=1)
+        T[1:-1] /= 2
+    psi = sqrt(n - 1) * sigma/sqrt(1 - rho**2)
+    grid = np.linspace(-psi, psi, n) + mu/(1 - rho)
+    return _readonly(grid, T)
+
+
+def rouwenhorst(rho, sigma, n=7, mu=0.0):
+    '''
+    discretizes y(t+1) = mu + rho*y(t) + e(t+1), e ~ N(0, sigma^2), by
+    Rouwenhorst's method, which matches the persistence and variance of the
+    process for any rho, and stays accurate when rho is close to 1
+
+    Parameters
+    ----------
+    rho : float
+        autoregressive coefficient, |rho| < 1
+    sigma : float
+        standard deviation of the innovation
+    n : int
+        number of states
+    mu : float
+        constant of the process
+
+    Returns
+    -------
+    grid, T
+    grid: evenly spaced states of y
+    T: transition matrix, T(i,j) = probability (y(t+1)=grid(j)|y(t)=grid(i))
+
+    results are cached by parameters and returned read-only; copy them
+    before modifying
+    '''
+    if n < 2:
+        raise ValueError('Discretization needs at least 2 states')
+    return _rouwenhorst(float(rho), float(sigma), int(n), float(mu))
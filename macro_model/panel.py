@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:05:19 2026
+
+@author: Zicong Huang
+
+panel simulation of the stochastic growth model from its solved decision
+rule
+
+every economy is a pair of indices (capital, shock). Capital, output,
+consumption and investment are tabulated once per state, so a period of
+the whole panel is a shock draw, one gather of the decision rule and one
+gather of the table. Only running sums are kept, never the panel itself:
+per economy the sums of x, x^2 and x_t x_{t-1}, from which the time-series
+mean, standard deviation and first-order autocorrelation follow
+"""
+
+import numpy as np
+from .markov import check_transition, cumulative_transition
+
+VARIABLES = ('k', 'y', 'c', 'i')
+
+
+def state_table(decision, kgrid, output, delta):
+    '''
+    capital, output, consumption and investment in every (capital, shock)
+    state under a decision rule, with
+
+        c + i = y,    k' = delta*k + i
+
+    as in 11_stoch_growth.py (delta is 1 - depreciation rate)
+
+    Parameters
+    ----------
+    decision : ndarray of int
+        (nk x ns) indices of next period capital
+    kgrid : ndarray
+        (nk,) capital grid
+    output : ndarray
+        (nk x ns) output in each state, e.g. A*k^alpha
+    delta : float
+        1 - depreciation rate
+
+    Returns
+    -------
+    table : ndarray
+        (nk*ns x 4) columns k, y, c, i; states stacked in F order, so
+        state k_index + nk*s_index
+    '''
+    kgrid = np.asarray(kgrid, dtype=float)
+    nk, ns = decision.shape
+    k = np.repeat(kgrid[:,None], ns, axis=1)
+    invest = kgrid[decision] - delta*k
+    y = np.broadcast_to(np.asarray(output, dtype=float), (nk, ns))
+    columns = [k, y, y - invest, invest]
+    return np.stack([x.flatten('F') for x in columns], axis=1)
+
+
+def simulate_panel(decision, prob, kgrid, output, delta, T=200, n_econ=100000,
+                   burn=0, k0=None, s0=None, seed=None, per_economy=False):
+    '''
+    simulates a panel of economies and returns time-series moments of
+    capital, output, consumption and investment
+
+    Parameters
+    ----------
+    decision : ndarray of int
+        (nk x ns) indices of next period capital, col a: shock a this period
+    prob : ndarray
+        prob(a,b) = probability (A(t+1)=Ab|A(t)=Aa)
+    kgrid : ndarray
+        (nk,) capital grid
+    output : ndarray
+        (nk x ns) output in each state
+    delta : float
+        1 - depreciation rate
+    T : int
+        periods kept per economy, after burn
+    n_econ : int
+        number of economies
+    burn : int
+        periods simulated and discarded first
+    k0, s0 : int or array of int, optional
+        initial capital and shock indices; drawn from the stationary
+        distribution of decision if None
+    seed : int or SeedSequence, optional
+        seed of the random draws
+    per_economy : bool
+        return each economy's moments instead of their averages
+
+    Returns
+    -------
+    moments : dict
+        for each of 'k', 'y', 'c', 'i' a dict with the time-series 'mean',
+        'std' and 'autocorr' (first order), averaged across economies, or
+        (n_econ,) arrays with per_economy
+    '''
+    prob = check_transition(prob)
+    decision = np.asarray(decision)
+    nk, ns = decision.shape
+    if prob.shape[0] != ns:
+        raise ValueError('decision needs one column per shock state')
+    if T < 2:
+        raise ValueError('T must be at least 2 for autocorrelations')
+    rng = np.random.default_rng(seed)
+
+    table = state_table(decision, kgrid, output, delta)
+    # next capital index of every state, in the F order of the table
+    next_k = decision.flatten('F').astype(np.intp)
+    thresholds = np.ascontiguousarray(cumulative_transition(prob)[:,:-1])
+
+    if k0 is None or s0 is None:
+        from .stationary import stationary_distribution
+        dist = stationary_distribution(decision, prob).flatten('F')
+        state = rng.choice(nk*ns, size=n_econ, p=dist/dist.sum())
+        k, s = state % nk, state // nk
+    if k0 is not None:
+        k = np.broadcast_to(np.asarray(k0, dtype=np.intp), (n_econ,)).copy()
+    if s0 is not None:
+        s = np.broadcast_to(np.asarray(s0, dtype=np.intp), (n_econ,)).copy()
+
+    u = np.empty(n_econ)
+    def advance(k, s):
+        k = np.take(next_k, k + nk*s)
+        rng.random(out=u)
+        # shock by inverse cdf, as in markov.markov_paths
+        s = np.count_nonzero(u[:,None] > np.take(thresholds, s, axis=0), axis=1)
+        return k, s
+
+    for _ in range(burn):
+        k, s = advance(k, s)
+
+    # running sums of deviations from each economy's first period, which
+    # keeps the variance free of cancellation
+    first = np.take(table, k + nk*s, axis=0)
+    x, prev, work = np.empty_like(first), np.zeros_like(first), np.empty_like(first)
+    total = np.zeros_like(first)
+    squares = np.zeros_like(first)
+    cross = np.zeros_like(first)
+    for _ in range(1, T):
+        k, s = advance(k, s)
+        np.take(table, k + nk*s, axis=0, out=x)
+        x -= first
+        total += x
+        squares += np.multiply(x, x, out=work)
+        cross += np.multiply(x, prev, out=work)
+        x, prev = prev, x
+    last = prev
+
+    # period 1 contributes zeros to every sum
+    mean = total/T
+    var = squares/T - mean**2
+    # sum over t >= 2 of (x_t - m)(x_{t-1} - m), first period x_1 = 0
+    autocov = cross - mean*(total - last) - mean*total + (T - 1)*mean**2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        autocorr = autocov / (T*var)
+    std = np.sqrt(np.maximum(var, 0))
+    mean = mean + first
+
+    moments = {}
+    for j, name in enumerate(VARIABLES):
+        if per_economy:
+            moments[name] = {'mean': mean[:,j], 'std': std[:,j], 'autocorr': autocorr[:,j]}
+        else:
+            moments[name] = {'mean': float(mean[:,j].mean()), 'std': float(std[:,j].mean()),
+                             'autocorr': float(np.nanmean(autocorr[:,j]))}
+    return moments
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:02:33 2026
+
+@author: Zicong Huang
+
+Solow and AK models simulated for many parameter sets at once
+
+every parameter may be a scalar or an array; arrays are broadcast against
+each other and each element of the broadcast shape is one economy. All
+economies are advanced together, one vectorized step per period, and every
+path is returned with time along the last axis
+"""
+
+import numpy as np
+
+def _broadcast(**params):
+    arrays = np.broadcast_arrays(*[np.asarray(p, dtype=float) for p in params.values()])
+    return arrays[0].shape, dict(zip(params, [a.ravel() for a in arrays]))
+
+
+def _paths(shape, **series):
+    '''moves time from the first to the last axis and restores the shape'''
+    return {key: np.moveaxis(x, 0, -1).reshape(shape + (x.shape[0],))
+            for key, x in series.items()}
+
+
+def simulate_solow(T, s, n, delta, alpha, A, g=0.0, K0=1.0, N0=1.0, E0=1.0):
+    '''
+    simulates the Solow model with labor-augmenting technology
+
+        k_{t+1} = ((1-delta) k_t + s A k_t^alpha) / ((1+g)(1+n))
+
+    where k is capital per effective labor; g = 0 and E0 = 1 give the
+    baseline model of 6_solow.py
+
+    Parameters
+    ----------
+    T : int
+        number of periods to simulate
+    s, n, delta, alpha, A, g : float or array-like
+        saving rate, population growth, depreciation rate, capital share of
+        income, TFP and growth of labor-effectiveness
+    K0, N0, E0 : float or array-like
+        initial capital, population and labor-effectiveness
+
+    Returns
+    -------
+    paths : dict
+        'K_EN' capital per effective labor, 'K_N' capital per worker,
+        'Y_N' output per worker, 'wage', 'rent' rental rate of capital,
+        'N' population and 'E' labor-effectiveness, each of shape
+        broadcast shape + (T,)
+    '''
+    shape, p = _broadcast(s=s, n=n, delta=delta, alpha=alpha, A=A, g=g,
+                          K0=K0, N0=N0, E0=E0)
+    m = p['s'].size
+
+    K_EN = np.empty((T, m))
+    K_EN[0] = p['K0'] / (p['E0'] * p['N0'])
+    keep = (1 - p['delta']) / ((1 + p['g']) * (1 + p['n']))
+    invest = p['s'] * p['A'] / ((1 + p['g']) * (1 + p['n']))
+    for t in range(T-1):
+        K_EN[t+1] = keep*K_EN[t] + invest*(K_EN[t]**p['alpha'])
+
+    time = np.arange(T)[:,None]
+    N = p['N0'] * (1 + p['n'])**time
+    E = p['E0'] * (1 + p['g'])**time
+    Y_EN = p['A'] * K_EN**p['alpha']
+
+    return _paths(shape, K_EN=K_EN, K_N=K_EN*E, Y_N=Y_EN*E,
+                  wage=(1 - p['alpha'])*Y_EN*E, rent=p['alpha']*Y_EN/K_EN,
+                  N=N, E=E)
+
+
+def simulate_mrw(T, sk, sh, n, g, delta_k, delta_h, alpha, beta, A,
+                 K0=1.0, H0=1.0, N0=1.0, E0=1.0):
+    '''
+    simulates the Mankiw-Romer-Weil model with human capital of
+    9_solow_MRW.py
+
+        k_{t+1} = ((1-delta_k) k_t + sk A k_t^alpha h_t^beta) / ((1+g)(1+n))
+        h_{t+1} = ((1-delta_h) h_t + sh A k_t^alpha h_t^beta) / ((1+g)(1+n))
+
+    with k and h physical and human capital per effective labor
+
+    Parameters
+    ----------
+    T : int
+        number of periods to simulate
+    sk, sh : float or array-like
+        saving rates of physical and human capital
+    n, g : float or array-like
+        population and labor-augmenting technology growth rates
+    delta_k, delta_h : float or array-like
+        depreciation rates of physical and human capital
+    alpha, beta : float or array-like
+        physical and human capital income shares of output
+    A : float or array-like
+        TFP
+    K0, H0, N0, E0 : float or array-like
+        initial physical and human capital, population and
+        labor-effectiveness
+
+    Returns
+    -------
+    paths : dict
+        'K_EN', 'H_EN' per effective labor, 'K_N', 'H_N', 'Y_N' per worker,
+        'wage', 'rent_k', 'rent_h' real returns, 'N' and 'E', each of shape
+        broadcast shape + (T,)
+    '''
+    shape, p = _broadcast(sk=sk, sh=sh, n=n, g=g, delta_k=delta_k,
+                          delta_h=delta_h, alpha=alpha, beta=beta, A=A,
+                          K0=K0, H0=H0, N0=N0, E0=E0)
+    m = p['sk'].size
+
+    K_EN = np.empty((T, m))
+    H_EN = np.empty((T, m))
+    K_EN[0] = p['K0'] / (p['E0'] * p['N0'])
+    H_EN[0] = p['H0'] / (p['E0'] * p['N0'])
+    growth = (1 + p['g']) * (1 + p['n'])
+    keep_k = (1 - p['delta_k']) / growth
+    keep_h = (1 - p['delta_h']) / growth
+    for t in range(T-1):
+        Y_EN = p['A'] * (K_EN[t]**p['alpha']) * (H_EN[t]**p['beta'])
+        K_EN[t+1] = keep_k*K_EN[t] + (p['sk']/growth)*Y_EN
+        H_EN[t+1] = keep_h*H_EN[t] + (p['sh']/growth)*Y_EN
+
+    time = np.arange(T)[:,None]
+    N = p['N0'] * (1 + p['n'])**time
+    E = p['E0'] * (1 + p['g'])**time
+    Y_EN = p['A'] * (K_EN**p['alpha']) * (H_EN**p['beta'])
+    gamma = 1 - p['alpha'] - p['beta']
+
+    return _paths(shape, K_EN=K_EN, H_EN=H_EN, K_N=K_EN*E, H_N=H_EN*E,
+                  Y_N=Y_EN*E, wage=gamma*Y_EN*E,
+                  rent_k=p['alpha']*Y_EN/K_EN, rent_h=p['beta']*Y_EN/H_EN,
+                  N=N, E=E)
+
+
+def simulate_ak(T, s, n, delta, alpha, A, K0=1.0, N0=1.0):
+    '''
+    simulates the AK model of 7_AK_model.py, Y = A K, where capital per
+    worker grows without bound
+
+        k_{t+1} = ((1-delta) k_t + s A k_t) / (1+n)
+
+    and factor prices are those of a Cobb-Douglas economy with capital
+    share alpha whose measured TFP is A k^(1-alpha)
+
+    Parameters
+    ----------
+    T : int
+        number of periods to simulate
+    s, n, delta, alpha, A : float or array-like
+        saving rate, population growth, depreciation rate, capital share of
+        income and the productivity of capital
+    K0, N0 : float or array-like
+        initial capital and population
+
+    Returns
+    -------
+    paths : dict
+        'K_N' capital per worker, 'Y_N' output per worker, 'TFP' measured
+        TFP, 'wage', 'rent' rental rate of capital, 'K' capital and 'N'
+        population, each of shape broadcast shape + (T,)
+    '''
+    shape, p = _broadcast(s=s, n=n, delta=delta, alpha=alpha, A=A, K0=K0, N0=N0)
+
+    # linear in k, so the path is a geometric sequence
+    time = np.arange(T)[:,None]
+    growth = ((1 - p['delta']) + p['s']*p['A']) / (1 + p['n'])
+    K_N = (p['K0'] / p['N0']) * growth**time
+    N = p['N0'] * (1 + p['n'])**time
+    TFP = p['A'] * K_N**(1 - p['alpha'])
+    Y_N = TFP * K_N**p['alpha']
+
+    return _paths(shape, K_N=K_N, Y_N=Y_N, TFP=TFP,
+                  wage=(1 - p['alpha'])*Y_N, rent=p['alpha']*Y_N/K_N,
+                  K=K_N*N, N=N)
+
+
+def steady_state(s, n, delta, alpha, A, g=0.0, approx=False):
+    '''
+    steady state capital per effective labor of simulate_solow, where
+    s A k^alpha = ((1+g)(1+n) - (1-delta)) k
+
+    Parameters
+    ----------
+    s, n, delta, alpha, A, g : float or array-like
+        as in simulate_solow, broadcast against each other
+    approx : bool
+        use the break-even investment line (n + g + delta) k of the Solow
+        diagram instead of the exact ((1+g)(1+n) - (1-delta)) k
+
+    Returns
+    -------
+    k_ss : float or ndarray
+        positive crossing of saving and break-even investment
+    '''
+    s, n, delta, alpha, A, g = np.broadcast_arrays(
+        *[np.asarray(p, dtype=float) for p in (s, n, delta, alpha, A, g)])
+    if approx:
+        breakeven = n + g + delta
+    else:
+        breakeven = (1 + g)*(1 + n) - (1 - delta)
+    k_ss = (s*A/breakeven)**(1/(1-alpha))
+    return k_ss[()] if k_ss.ndim == 0 else k_ss
+
+
+def steady_state_mrw(sk, sh, n, g, delta_k, delta_h, alpha, beta, A):
+    '''
+    steady state physical and human capital per effective labor of
+    simulate_mrw, using n + g + delta for break-even investment as in
+    9_solow_MRW.py
+
+    Returns
+    -------
+    k_ss, h_ss : float or ndarray
+    '''
+    sk, sh, n, g, delta_k, delta_h, alpha, beta, A = np.broadcast_arrays(
+        *[np.asarray(p, dtype=float)
+          for p in (sk, sh, n, g, delta_k, delta_h, alpha, beta, A)])
+    gamma = 1 - alpha - beta
+    sk_eff = sk*A/(n + g + delta_k)
+    sh_eff = sh*A/(n + g + delta_h)
+    k_ss = ((sk_eff**(1-beta)) * (sh_eff**beta))**(1/gamma)
+    h_ss = ((sk_eff**alpha) * (sh_eff**(1-alpha)))**(1/gamma)
+    if k_ss.ndim == 0:
+        return k_ss[()], h_ss[()]
+    return k_ss, h_ss
+
+
+def find_crossing(f, lo, hi, tol=1e-12, max_iter=200):
+    '''
+    finds x with f(x) = 0 in [lo, hi] for many brackets at once, by secant
+    (false position) steps alternated with bisection; for intersections
+    without a closed form, e.g. f = inflow - outflow of a Solow diagram
+
+    Parameters
+    ----------
+    f : function
+        vectorized, f(x) returns an array of the shape of x
+    lo, hi : array-like
+        brackets, broadcast against each other; f(lo) and f(hi) must have
+        opposite signs
+    tol : float
+        stop when every bracket is narrower than tol*(1 + |x|)
+    max_iter : int
+        maximum number of iterations
+
+    Returns
+    -------
+    x : ndarray
+        the crossing in each bracket, nan where f does not change sign
+    '''
+    lo, hi = np.broadcast_arrays(np.asarray(lo, dtype=float), np.asarray(hi, dtype=float))
+    lo, hi = lo.astype(float), hi.astype(float)
+    flo, fhi = f(lo), f(hi)
+    valid = np.sign(flo) * np.sign(fhi) <= 0
+
+    x = np.where(valid, (lo + hi)/2, np.nan)
+    for it in range(max_iter):
+        # secant step within the bracket, bisection where it would leave it
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = lo - flo*(hi - lo)/(fhi - flo)
+        mid = (lo + hi)/2
+        x = np.where(np.isfinite(x) & (x > lo) & (x < hi), x, mid)
+        # alternate with bisection so that one-sided convergence cannot stall
+        if it % 2 == 1:
+            x = mid
+        fx = f(x)
+        left = np.sign(fx) == np.sign(flo)
+        lo, flo = np.where(left, x, lo), np.where(left, fx, flo)
+        hi, fhi = np.where(left, hi, x), np.where(left, fhi, fx)
+        exact = fx == 0
+        lo, hi = np.where(exact, x, lo), np.where(exact, x, hi)
+        if np.all((hi - lo)[valid] <= tol*(1 + np.abs(x[valid]))):
+            break
+
+    x = np.where(valid, (lo + hi)/2, np.nan)
+    return x[()] if x.ndim == 0 else x
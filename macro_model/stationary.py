@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:12:40 2026
+
+@author: Zicong Huang
+
+stationary distribution of (capital, shock) implied by a discrete decision
+rule k' = kgrid[decision[i,a]] and a Markov shock process prob.
+
+each row of the state-to-state transition matrix has one nonzero per shock
+next period, so the transition is applied as a scatter-add over the decision
+indices instead of a dense (nk*ns x nk*ns) matrix
+"""
+
+import numpy as np
+
+def _check_decision(decision, prob):
+    decision = np.asarray(decision)
+    prob = np.asarray(prob, dtype=float)
+    if decision.ndim == 1:
+        decision = decision[:,None]
+    nk, ns = decision.shape
+    if prob.shape != (ns, ns):
+        raise ValueError('prob must be a square matrix with one row per column of decision')
+    if np.any((decision < 0) | (decision >= nk)):
+        raise ValueError('decision must hold indices into the capital grid')
+    return decision.astype(np.intp), prob
+
+
+def transition_operator(decision, prob):
+    '''
+    returns a function that maps a distribution today into tomorrow's
+
+    Parameters
+    ----------
+    decision : ndarray of int
+        (nk x ns) indices of next period capital, col a: shock a this period
+    prob : ndarray
+        prob(a,b) = probability (A(t+1)=Ab|A(t)=Aa)
+
+    Returns
+    -------
+    step : function
+        step(dist) with dist an (nk x ns) distribution over (capital, shock)
+    '''
+    decision, prob = _check_decision(decision, prob)
+    nk, ns = decision.shape
+    # position of k' in the flattened (shock, capital) layout
+    target = (decision + nk * np.arange(ns)).flatten('F')
+
+    def step(dist):
+        # mass arriving at each k', still indexed by today's shock
+        mass = np.bincount(target, weights=dist.flatten('F'), minlength=nk*ns)
+        return mass.reshape((nk, ns), order='F') @ prob
+
+    return step
+
+
+def transition_matrix(decision, prob):
+    '''
+    sparse transition matrix from state (capital, shock) at t (row) to the
+    state at t+1 (col); states are stacked shock by shock, as in
+    decision.flatten('F')
+    '''
+    from scipy import sparse
+
+    decision, prob = _check_decision(decision, prob)
+    nk, ns = decision.shape
+    rows = np.arange(nk * ns).repeat(ns)
+    shock = np.repeat(np.arange(ns), nk).repeat(ns)
+    shock_next = np.tile(np.arange(ns), nk * ns)
+    cols = decision.flatten('F').repeat(ns) + nk * shock_next
+    vals = prob[shock, shock_next]
+    return sparse.csr_matrix((vals, (rows, cols)), shape=(nk*ns, nk*ns))
+
+
+def _stationary_eig(decision, prob):
+    from scipy.sparse.linalg import eigs
+
+    nk, ns = np.shape(decision)[0], np.shape(prob)[0]
+    trans = transition_matrix(decision, prob)
+    # the eigenvector of trans' associated with the unit eigenvalue
+    val, vec = eigs(trans.T, k=1, which='LM')
+    dist = np.abs(np.real(vec[:,0]))
+    return (dist / dist.sum()).reshape((nk, ns), order='F')
+
+
+def stationary_distribution(decision, prob, tol=1e-8, max_iter=10000, method='power',
+                            callback=None):
+    '''
+    computes the stationary distribution over (capital, shock)
+
+    Parameters
+    ----------
+    decision : ndarray of int
+        (nk x ns) indices of next period capital, col a: shock a this period
+    prob : ndarray
+        prob(a,b) = probability (A(t+1)=Ab|A(t)=Aa)
+    tol : float
+        convergence criterion on the sup-norm change of the distribution
+    max_iter : int
+        maximum number of power iterations before falling back to the
+        sparse eigenvalue solver
+    method : str
+        'power' iterates the transition from a uniform distribution,
+        'eig' goes straight to the sparse eigenvalue solver
+    callback : function, optional
+        called after every power iteration as
+        callback('stationary', it, error=test), and as
+        callback('stationary', 0) before the first; see trace.Trace
+
+    Returns
+    -------
+    dist : ndarray
+        (nk x ns) stationary probabilities, same layout as decision
+    '''
+    decision, prob = _check_decision(decision, prob)
+    if method == 'eig':
+        return _stationary_eig(decision, prob)
+    if method != 'power':
+        raise ValueError("method must be 'power' or 'eig'")
+
+    nk, ns = decision.shape
+    step = transition_operator(decision, prob)
+    dist = np.full((nk, ns), 1/(nk*ns))
+    if callback is not None:
+        callback('stationary', 0)
+    for it in range(1, max_iter+1):
+        dist1 = step(dist)
+        test = np.max(np.abs(dist1 - dist))
+        dist = dist1
+        if callback is not None:
+            callback('stationary', it, error=float(test))
+        if test <= tol:
+            return dist
+
+    # power iteration is slow when the chain mixes slowly (or cycles)
+    return _stationary_eig(decision, prob)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:04:12 2026
+
+@author: Zicong Huang
+
+columnar cache for spreadsheet inputs
+
+a spreadsheet (xlsx, xls, ods or csv) is parsed once and every column is
+saved as its own .npy file; later loads memory-map the columns instead of
+parsing the workbook again. The cache is keyed on the source path and the
+read options, and is rebuilt when the source changes: a changed size or
+mtime triggers a sha256 of the file, and only a changed hash reparses it
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+
+# short names of the columns of USGDP_1790-2019.xlsx, in sheet order
+USGDP_COLUMNS = ['year', 'nominal_gdp', 'real_gdp', 'gdp_deflator',
+                 'population', 'nominal_gdp_pc', 'real_gdp_pc']
+
+
+def default_cache_dir():
+    '''$TABLE_CACHE_DIR, or ~/.cache/macro_model/tables'''
+    return os.environ.get('TABLE_CACHE_DIR',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'macro_model', 'tables'))
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_source(path, read_kwargs):
+    import pandas as pd
+    if os.path.splitext(path)[1].lower() in ('.csv', '.txt'):
+        return pd.read_csv(path, **read_kwargs)
+    return pd.read_excel(path, **read_kwargs)
+
+
+def _column_array(column):
+    '''a column as an ndarray that np.load can memory-map'''
+    values = column.to_numpy()
+    if values.dtype.kind in 'biufcmM':
+        return values
+    # strings (and mixed columns) become fixed-width unicode, missing as ''
+    return np.array(['' if v is None or v != v else str(v) for v in values])
+
+
+def _write_json(path, content):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(content, f, indent=1)
+    os.replace(tmp, path)
+
+
+def _build(path, folder, source, read_kwargs, names):
+    frame = _read_source(path, read_kwargs)
+    headers = [str(h) for h in frame.columns]
+    if names is None:
+        names = headers
+    elif len(names) != len(headers):
+        raise ValueError('%s has %d columns, %d names given'
+                         % (path, len(headers), len(names)))
+
+    os.makedirs(folder, exist_ok=True)
+    columns = []
+    for i, (name, header) in enumerate(zip(names, headers)):
+        values = _column_array(frame.iloc[:, i])
+        file = '%s__%d.npy' % (source['sha256'][:16], i)
+        tmp = os.path.join(folder, file + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, values, allow_pickle=False)
+        os.replace(tmp, os.path.join(folder, file))
+        columns.append({'name': name, 'header': header, 'file': file,
+                        'dtype': values.dtype.str})
+
+    # the manifest is written last, so a half-built cache is never used
+    _write_json(os.path.join(folder, 'manifest.json'),
+                {'source': source, 'columns': columns})
+    keep = {c['file'] for c in columns} | {'manifest.json'}
+    for file in os.listdir(folder):
+        if file not in keep:
+            os.remove(os.path.join(folder, file))
+    return columns
+
+
+def load_table(path, names=None, cache_dir=None, as_frame=False, mmap=True,
+               **read_kwargs):
+    '''
+    loads a spreadsheet through the columnar cache
+
+    Parameters
+    ----------
+    path : str
+        xlsx, xls, ods or csv file
+    names : list of str, optional
+        names for the columns in sheet order; the sheet headers if None
+    cache_dir : str, optional
+        cache directory, default_cache_dir() if None
+    as_frame : bool
+        return a pandas DataFrame instead of a dict of arrays
+    mmap : bool
+        memory-map the cached columns (read-only) instead of reading them
+        into memory
+    **read_kwargs
+        passed to pandas.read_excel (or read_csv), e.g. header=1 or
+        sheet_name; part of the cache key
+
+    Returns
+    -------
+    table : dict or DataFrame
+        column name -> typed ndarray, in sheet order
+    '''
+    path = os.path.abspath(path)
+    cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+    key = json.dumps([path, names, read_kwargs], sort_keys=True, default=str)
+    folder = os.path.join(cache_dir, '%s__%s' % (os.path.basename(path),
+                                                 hashlib.sha256(key.encode()).hexdigest()[:16]))
+    manifest_path = os.path.join(folder, 'manifest.json')
+
+    stat = os.stat(path)
+    source = {'path': path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+
+    columns = None
+    if manifest is not None:
+        cached = manifest['source']
+        if cached['size'] == source['size'] and cached['mtime_ns'] == source['mtime_ns']:
+            columns = manifest['columns']
+        else:
+            # touched but possibly unchanged: compare contents before reparsing
+            source['sha256'] = _file_hash(path)
+            if source['sha256'] == cached['sha256']:
+                columns = manifest['columns']
+                _write_json(manifest_path, {'source': source, 'columns': columns})
+    if columns is None:
+        source.setdefault('sha256', _file_hash(path))
+        columns = _build(path, folder, source, read_kwargs, names)
+
+    table = {c['name']: np.load(os.path.join(folder, c['file']),
+                                mmap_mode='r' if mmap else None, allow_pickle=False)
+             for c in columns}
+    if as_frame:
+        import pandas as pd
+        return pd.DataFrame(table, copy=False)
+    return table
+
+
+def load_usgdp(path='USGDP_1790-2019.xlsx', **kwargs):
+    '''
+    the MeasuringWorth US GDP workbook with the columns of USGDP_COLUMNS:
+    year, nominal GDP (millions of dollars), real GDP (millions of 2012
+    dollars), GDP deflator (2012 = 100), population (thousands), and
+    nominal and real GDP per capita (dollars); kwargs go to load_table
+    '''
+    return load_table(path, names=USGDP_COLUMNS, header=1, **kwargs)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:41:27 2026
+
+@author: Zicong Huang
+
+time series tools for the FRED data scripts
+
+the Hodrick-Prescott trend solves (I + lamb D'D) trend = y, with D the
+second difference operator. The matrix is symmetric pentadiagonal, so it is
+factored once by banded Cholesky, O(n), and every series of the same length
+is filtered by two banded triangular solves
+"""
+
+from functools import lru_cache
+import numpy as np
+
+def _next_period(index):
+    '''the date one period after the end of index'''
+    freq = getattr(index, 'freq', None)
+    if freq is not None:
+        return index[-1] + freq
+    if len(index) < 2:
+        raise ValueError('cannot infer the period of a series with one observation')
+    return index[-1] + (index[-1] - index[-2])
+
+
+def indicator_intervals(indicator):
+    '''
+    periods where a 0/1 indicator is on, e.g. the NBER recession indicator
+    USREC, found by run-length encoding in one vectorized pass
+
+    each run of ones becomes the interval [start, end) from its first date to
+    the first date after it, closed on the left; a run open at the end of
+    the series ends one period after the last observation, and a run open at
+    the start begins at the first observation
+
+    Parameters
+    ----------
+    indicator : pandas Series
+        0/1 values on an increasing index, missing values count as 0
+
+    Returns
+    -------
+    intervals : pandas IntervalIndex
+    '''
+    import pandas as pd
+
+    on = np.nan_to_num(np.asarray(indicator, dtype=float)) != 0
+    # +1 where a run starts, -1 at the first period after it ends
+    change = np.diff(np.concatenate([[0], on.view(np.int8), [0]]))
+    starts = np.flatnonzero(change == 1)
+    ends = np.flatnonzero(change == -1)
+
+    index = indicator.index
+    if len(ends) and ends[-1] == len(index):
+        index = index.append(pd.Index([_next_period(index)]))
+    return pd.IntervalIndex.from_arrays(index[starts], index[ends], closed='left')
+
+
+def in_intervals(dates, intervals):
+    '''
+    membership of many dates in sorted, non-overlapping intervals, by
+    binary search on the left ends
+
+    Parameters
+    ----------
+    dates : array-like
+        dates to tag, any order
+    intervals : pandas IntervalIndex
+        sorted, non-overlapping intervals, e.g. from indicator_intervals
+
+    Returns
+    -------
+    inside : ndarray
+        bool, True where the date falls in one of the intervals
+    '''
+    import pandas as pd
+
+    dates = pd.Index(dates)
+    if len(intervals) == 0:
+        return np.zeros(len(dates), dtype=bool)
+    # the last interval starting at (or before) each date
+    side = 'right' if intervals.closed in ('left', 'both') else 'left'
+    pos = intervals.left.searchsorted(dates, side=side) - 1
+    ends = intervals.right[np.maximum(pos, 0)]
+    if intervals.closed in ('right', 'both'):
+        return (pos >= 0) & np.asarray(dates <= ends)
+    return (pos >= 0) & np.asarray(dates < ends)
+
+
+@lru_cache(maxsize=32)
+def _hp_factor(n, lamb):
+    '''banded Cholesky factor (upper form) of I + lamb D'D for n periods'''
+    from scipy.linalg import cholesky_banded
+    # D'D accumulated from the rows (1, -2, 1) of D
+    diag = np.ones(n)
+    diag[:-2] += lamb
+    diag[1:-1] += 4*lamb
+    diag[2:] += lamb
+    off1 = np.zeros(n-1)
+    off1[:-1] -= 2*lamb
+    off1[1:] -= 2*lamb
+    off2 = np.full(n-2, lamb)
+
+    ab = np.zeros((3, n))
+    ab[0,2:] = off2
+    ab[1,1:] = off1
+    ab[2] = diag
+    factor = cholesky_banded(ab)
+    factor.flags.writeable = False
+    return factor
+
+
+def _wrap(like, values):
+    '''returns values as a pandas object shaped like the input, if it was one'''
+    import pandas as pd
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(values, index=like.index, columns=like.columns)
+    if isinstance(like, pd.Series):
+        return pd.Series(values, index=like.index, name=like.name)
+    return values
+
+
+def hpfilter(x, lamb=1600):
+    '''
+    Hodrick-Prescott filter, a banded replacement for statsmodels'
+    hpfilter that also filters a block of series at once
+
+    Parameters
+    ----------
+    x : array-like, Series or DataFrame
+        (n,) series or (n x m) block of series, time along the first axis
+    lamb : float
+        smoothing parameter, 1600 for quarterly data
+
+    Returns
+    -------
+    cycle, trend
+    cycle: x - trend
+    trend: smoothed series, same shape (and pandas type) as x
+    '''
+    from scipy.linalg import cho_solve_banded
+
+    y = np.asarray(x, dtype=float)
+    n = y.shape[0]
+    if n < 3:
+        trend = y.copy()
+    else:
+        trend = cho_solve_banded((_hp_factor(n, float(lamb)), False), y,
+                                 check_finite=False)
+    return _wrap(x, y - trend), _wrap(x, trend)
+
+
+class RealTimeHP:
+    '''
+    one-sided (real-time) Hodrick-Prescott filter
+
+    the trend at t uses only observations up to t: it is the last point of
+    the two-sided filter of the sample so far. It is computed by the Kalman
+    filter of the model behind the HP filter,
+
+        y_t = trend_t + cycle_t,                  var(cycle) = lamb
+        trend_{t+1} = 2 trend_t - trend_{t-1} + e_t,  var(e) = 1
+
+    so each new observation is one O(1) update rather than a new fit. The
+    gains do not depend on the data and are shared by all series
+
+    Parameters
+    ----------
+    lamb : float
+        smoothing parameter, 1600 for quarterly data
+    n_series : int, optional
+        number of series updated together; None for a single series
+    '''
+
+    # (trend_t, trend_{t-1}) -> (trend_{t+1}, trend_t)
+    transition = np.array([[2.0, -1.0], [1.0, 0.0]])
+
+    def __init__(self, lamb=1600, n_series=None):
+        self.lamb = float(lamb)
+        self.shape = () if n_series is None else (n_series,)
+        self.nobs = 0
+        # filtered (trend_t, trend_{t-1}) of each series and their covariance
+        self.state = np.zeros((2,) + self.shape)
+        self.cov = np.zeros((2, 2))
+
+    def update(self, y):
+        '''
+        adds the next observation of every series and returns the
+        real-time trend
+        '''
+        y = np.broadcast_to(np.asarray(y, dtype=float), self.shape)
+        if self.nobs < 2:
+            # with diffuse initial trends the first two fit exactly
+            self.state = np.stack([y, self.state[0]])
+            self.cov = self.lamb*np.eye(2)
+        else:
+            trend, lag = self.state
+            predicted = np.stack([2*trend - lag, trend])
+            P = self.transition @ self.cov @ self.transition.T
+            P[0,0] += 1.0
+            gain = P[:,0] / (P[0,0] + self.lamb)
+            self.cov = P - np.outer(gain, P[0])
+            gain = gain.reshape((2,) + (1,)*len(self.shape))
+            self.state = predicted + gain*(y - predicted[0])
+        self.nobs += 1
+        return self.state[0].copy()
+
+
+def hpfilter_onesided(x, lamb=1600):
+    '''
+    one-sided HP filter of a whole sample, see RealTimeHP
+
+    Parameters
+    ----------
+    x : array-like, Series or DataFrame
+        (n,) series or (n x m) block of series, time along the first axis
+    lamb : float
+        smoothing parameter
+
+    Returns
+    -------
+    cycle, trend
+    trend: trend at each t from the observations up to t
+    '''
+    y = np.asarray(x, dtype=float)
+    filt = RealTimeHP(lamb, None if y.ndim == 1 else y.shape[1])
+    trend = np.empty_like(y)
+    for t in range(y.shape[0]):
+        trend[t] = filt.update(y[t])
+    return _wrap(x, y - trend), _wrap(x, trend)
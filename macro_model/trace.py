@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:58:14 2026
+
+@author: Zicong Huang
+
+convergence traces of the iterative solvers
+
+solve_vfi, solve_multigrid, stationary_distribution, solve_egm,
+solve_lyapunov and doublej take a callback, called once per iteration as
+
+    callback(solver, iteration, error=..., **details)
+
+with the solver name, the iteration number, the sup-norm error the solver
+tests for convergence and solver-specific details (e.g. 'policy_changes'
+for value function iteration), and once as callback(solver, 0) when the
+loop starts. Without a callback nothing is computed for it and the loops
+cost one comparison more. A Trace is a callback that keeps every iteration
+as a row, with its time since the previous iteration or the start of the
+loop, so work between two solves is charged to neither
+"""
+
+import time
+import tracemalloc
+
+class Trace:
+    '''
+    records one row per solver iteration
+
+    each row has 'solver', 'iteration', 'error', any details the solver
+    passes, 'elapsed' seconds since the trace started and 'seconds' since
+    the previous iteration of the same solve (the first iteration: since
+    the solve started); with allocations=True also 'memory_mb', the memory
+    traced by tracemalloc, and 'peak_mb', its peak over the iteration
+
+    Parameters
+    ----------
+    allocations : bool
+        trace memory allocations; tracemalloc slows allocation-heavy code
+        noticeably, so it is off by default
+    echo : bool
+        also print each row, e.g. for long runs in a terminal
+
+    Examples
+    --------
+    >>> trace = Trace()
+    >>> v, decision, info = solve_vfi(update, v, beta, callback=trace)
+    >>> trace.to_csv('vfi.csv')
+    '''
+
+    def __init__(self, allocations=False, echo=False):
+        self.rows = []
+        self.allocations = allocations
+        self.echo = echo
+        self._started = allocations and not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self.start = self._last = time.perf_counter()
+
+    def __call__(self, solver, iteration, **details):
+        if iteration == 0:
+            # a solver starts its loop: restart the clock and the peak
+            if self.allocations:
+                tracemalloc.reset_peak()
+            self._last = time.perf_counter()
+            return
+        now = time.perf_counter()
+        row = {'solver': solver, 'iteration': iteration}
+        row.update(details)
+        row['elapsed'] = now - self.start
+        row['seconds'] = now - self._last
+        if self.allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            row['memory_mb'] = current / 2**20
+            row['peak_mb'] = peak / 2**20
+            tracemalloc.reset_peak()
+        self.rows.append(row)
+        if self.echo:
+            print(', '.join('%s: %s' % item for item in row.items()))
+        # time spent here is not charged to the next iteration
+        self._last = time.perf_counter()
+
+    def close(self):
+        '''stops tracemalloc if this trace started it'''
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def __len__(self):
+        return len(self.rows)
+
+    def columns(self):
+        '''all fields of the rows, in order of first appearance'''
+        names = {}
+        for row in self.rows:
+            names.update(dict.fromkeys(row))
+        return list(names)
+
+    def summary(self):
+        '''
+        per solver: number of iterations, total seconds and the last error
+
+        Returns
+        -------
+        summary : dict
+        '''
+        out = {}
+        for row in self.rows:
+            entry = out.setdefault(row['solver'], {'iterations': 0, 'seconds': 0.0})
+            entry['iterations'] += 1
+            entry['seconds'] += row['seconds']
+            entry['error'] = row.get('error')
+        return out
+
+    def to_csv(self, path):
+        import csv
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns())
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+    def to_json(self, path):
+        import json
+        with open(path, 'w') as f:
+            json.dump(self.rows, f, indent=1, default=float)
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=self.columns())
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:37 2026
+
+@author: Zicong Huang
+
+tests of the FRED client and FredCache.get_many against a local HTTP server
+"""
+
+import json
+import threading
+import urllib.parse
+import http.server
+import numpy as np
+import pytest
+from macro_model.fred_data import FredCache, FredClient
+
+# series id -> observation dates served for it
+SERIES = {'A': ['2000-01-01', '2001-01-01', '2002-01-01'],
+          'B': ['2001-01-01', '2002-01-01', '2003-01-01']}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    # keep-alive, so that clients can reuse their connection
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+        series_id = query.get('series_id')
+        with self.server.lock:
+            self.server.queries.append(query)
+            failures = self.server.failures.get(series_id, [])
+            status = failures.pop(0) if failures else 200
+        if status == 200:
+            dates = SERIES.get(series_id, [])
+            # FRED marks missing observations with '.'
+            values = ['.' if i == 1 and series_id == 'B' else str(i) for i in range(len(dates))]
+            body = json.dumps({'observations': [{'date': d, 'value': v}
+                                                for d, v in zip(dates, values)]})
+        else:
+            body = json.dumps({'error_message': 'status %d' % status})
+        body = body.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.queries = []
+    # series id -> statuses returned before the data, one per request
+    server.failures = {}
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, **kwargs):
+    options = dict(requests_per_minute=60000, retries=3, backoff=0.001, timeout=5)
+    options.update(kwargs)
+    return FredClient('key', 'http://127.0.0.1:%d/fred' % server.server_port, **options)
+
+
+def test_series_and_query(server):
+    series = make_client(server).get_series('B', observation_start='2001-01-01', frequency='a')
+    assert list(series.index.year) == [2001, 2002, 2003]
+    assert np.isnan(series.iloc[1]) and series.iloc[2] == 2
+    query = server.queries[0]
+    assert query['series_id'] == 'B' and query['frequency'] == 'a'
+    assert query['observation_start'] == '2001-01-01'
+    assert query['api_key'] == 'key' and query['file_type'] == 'json'
+
+
+def test_retry_on_429_and_5xx(server):
+    server.failures['A'] = [429, 503, 500]
+    series = make_client(server).get_series('A')
+    assert len(series) == 3
+    assert len(server.queries) == 4
+
+
+def test_retries_exhausted(server):
+    server.failures['A'] = [503] * 10
+    with pytest.raises(ConnectionError, match='503'):
+        make_client(server, retries=2).get_series('A')
+    assert len(server.queries) == 3
+
+
+def test_no_retry_on_4xx(server):
+    server.failures['A'] = [400]
+    with pytest.raises(ConnectionError, match='400'):
+        make_client(server).get_series('A')
+    assert len(server.queries) == 1
+
+
+def test_connection_reuse(server):
+    client = make_client(server)
+    for _ in range(5):
+        client.get_series('A')
+    assert len(server.queries) == 5
+    assert server.connections == 1
+
+
+def test_get_many_alignment(server, tmp_path):
+    cache = FredCache(cache_dir=str(tmp_path), offline=False, fred=make_client(server))
+    frame = cache.get_many(['B', 'A'], max_workers=2, units='pch')
+    assert list(frame.columns) == ['B', 'A']
+    assert list(frame.index.year) == [2000, 2001, 2002, 2003]
+    assert np.isnan(frame.loc['2000-01-01', 'B']) and np.isnan(frame.loc['2003-01-01', 'A'])
+    assert frame.loc['2001-01-01', 'A'] == 1 and frame.loc['2003-01-01', 'B'] == 2
+    assert all(query['units'] == 'pch' for query in server.queries)
+
+    # served from the cache the second time
+    again = cache.get_many(['B', 'A'], units='pch')
+    assert len(server.queries) == 2
+    assert np.allclose(frame.values, again.values, equal_nan=True)
+
+
+def test_one_default_client(tmp_path):
+    cache = FredCache(cache_dir=str(tmp_path), offline=False, api_key='key')
+    start = threading.Barrier(8)
+    clients = []
+    def get_client():
+        start.wait()
+        clients.append(cache.client())
+    threads = [threading.Thread(target=get_client) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # all threads share one client, and with it one rate limit
+    assert len({id(client) for client in clients}) == 1
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:10:52 2026
+
+@author: Zicong Huang
+
+tests of the FRED cache against a stand-in client
+"""
+
+import os
+import pandas as pd
+import pytest
+from macro_model.fred_data import FredCache
+
+class FakeFred:
+    '''stand-in for the FRED client: counts calls, fails on demand'''
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def get_series(self, series_id, observation_start=None, observation_end=None, **kwargs):
+        self.calls.append((series_id, kwargs))
+        if self.fail:
+            raise ConnectionError('FRED is down')
+        # annual data is one value per year, quarterly four
+        periods, freq = (3, 'YS') if kwargs.get('frequency') == 'a' else (12, 'QS')
+        index = pd.date_range('2000-01-01', periods=periods, freq=freq)
+        return pd.Series(range(periods), index=index, dtype=float, name=series_id)
+
+
+def age_cache(cache_dir, seconds):
+    '''makes every cached copy look fetched seconds earlier'''
+    for name in os.listdir(cache_dir):
+        stem, fetched = name[:-4].rsplit('__', 1)
+        os.rename(os.path.join(cache_dir, name),
+                  os.path.join(cache_dir, '%s__%d.npz' % (stem, int(fetched) - seconds)))
+
+
+def test_ttl_hit_and_miss(tmp_path):
+    fred = FakeFred()
+    cache = FredCache(cache_dir=str(tmp_path), ttl=3600, offline=False, fred=fred)
+    first = cache.get_series('GDP')
+    second = cache.get_series('GDP')
+    assert len(fred.calls) == 1
+    pd.testing.assert_series_equal(first, second, check_freq=False, check_index_type=False)
+
+    age_cache(tmp_path, 7200)
+    cache.get_series('GDP')
+    assert len(fred.calls) == 2
+    # the stale copy was replaced by the new one
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_offline_missing_series(tmp_path):
+    fred = FakeFred()
+    cache = FredCache(cache_dir=str(tmp_path), offline=True, fred=fred)
+    with pytest.raises(LookupError):
+        cache.get_series('GDP')
+    assert fred.calls == []
+
+
+def test_offline_serves_stale_copy(tmp_path):
+    fred = FakeFred()
+    FredCache(cache_dir=str(tmp_path), offline=False, fred=fred).get_series('GDP')
+    age_cache(tmp_path, 10**7)
+    cache = FredCache(cache_dir=str(tmp_path), ttl=3600, offline=True, fred=fred)
+    assert len(cache.get_series('GDP')) == 12
+    assert len(fred.calls) == 1
+
+
+def test_failed_refresh_serves_stale_copy(tmp_path):
+    fred = FakeFred()
+    cache = FredCache(cache_dir=str(tmp_path), ttl=3600, offline=False, fred=fred)
+    fresh = cache.get_series('GDP')
+    age_cache(tmp_path, 7200)
+    fred.fail = True
+    with pytest.warns(UserWarning, match='could not fetch GDP'):
+        stale = cache.get_series('GDP')
+    assert len(fred.calls) == 2
+    pd.testing.assert_series_equal(fresh, stale, check_freq=False, check_index_type=False)
+
+
+def test_failed_fetch_without_copy_raises(tmp_path):
+    fred = FakeFred()
+    fred.fail = True
+    cache = FredCache(cache_dir=str(tmp_path), offline=False, fred=fred)
+    with pytest.raises(ConnectionError):
+        cache.get_series('GDP')
+
+
+def test_query_parameters_in_cache_key(tmp_path):
+    fred = FakeFred()
+    cache = FredCache(cache_dir=str(tmp_path), ttl=3600, offline=False, fred=fred)
+    quarterly = cache.get_series('GDP')
+    annual = cache.get_series('GDP', frequency='a')
+    assert len(quarterly) == 12 and len(annual) == 3
+    assert fred.calls == [('GDP', {}), ('GDP', {'frequency': 'a'})]
+
+    # both stay cached side by side, and the order of parameters is irrelevant
+    assert len(cache.get_series('GDP')) == 12
+    assert len(cache.get_series('GDP', units='pch', frequency='a')) == 3
+    assert len(cache.get_series('GDP', frequency='a', units='pch')) == 3
+    assert len(fred.calls) == 3